@@ -1,6 +1,16 @@
 # 🚨 CAREER NAVIGATOR AGENTS - Tailored for Enhanced Data Layer
 # Gap Analysis + Roadmap Generation
 
+import json
+import os
+from functools import lru_cache
+
+import metrics
+from catalog import RoleWeights, get_job_catalog
+from prerequisites import get_prerequisite_graph
+from skills import REGISTRY
+
+
 def extract_all_skills_from_data(github_data, resume_data):
     """
     Extract and combine all skills from GitHub and Resume data structures
@@ -28,12 +38,16 @@ def extract_all_skills_from_data(github_data, resume_data):
         all_skills.extend(tech_skills.get('databases', []))
         all_skills.extend(tech_skills.get('ai_ml', []))
     
-    # Remove duplicates and normalize
-    unique_skills = list(set(skill.strip() for skill in all_skills if skill))
+    # Remove duplicates, treating aliases ("Node" / "Node.js") as the same skill
+    unique_skills = {}
+    for skill in all_skills:
+        if skill and skill.strip():
+            unique_skills.setdefault(REGISTRY.skill_id(skill), skill.strip())
     
-    return unique_skills
+    return list(unique_skills.values())
 
 
+@metrics.timed("gap_analysis")
 def analyze_skill_gaps(current_skills, job_requirements_dict):
     """
     Analyze gaps between current skills and job requirements
@@ -45,20 +59,16 @@ def analyze_skill_gaps(current_skills, job_requirements_dict):
     Returns:
         Dict with missing_required, missing_nice_to_have, and matched skills
     """
-    # Normalize skills to lowercase for comparison
-    user_set = set(s.lower().strip() for s in current_skills if s)
-    
-    # Get required and nice-to-have skills
-    required_skills = job_requirements_dict.get('required_skills', [])
-    nice_to_have = job_requirements_dict.get('nice_to_have', [])
+    # Compare interned skill IDs; aliases like "REST API" / "REST APIs" share an ID
+    user_ids = REGISTRY.ids(current_skills)
     
-    required_set = set(s.lower().strip() for s in required_skills if s)
-    nice_set = set(s.lower().strip() for s in nice_to_have if s)
+    # Catalog roles (catalog.JobRole) carry precomputed IDs; plain dicts are interned here
+    required_ids, nice_ids = _role_skill_ids(job_requirements_dict)
     
-    # Find gaps and matches
-    missing_required = list(required_set - user_set)
-    missing_nice = list(nice_set - user_set)
-    matched_skills = list(user_set & required_set)
+    # Find gaps and matches (reported by canonical lowercase name)
+    missing_required = REGISTRY.names(required_ids - user_ids)
+    missing_nice = REGISTRY.names(nice_ids - user_ids)
+    matched_skills = REGISTRY.names(user_ids & required_ids)
     
     return {
         'missing_required': missing_required,
@@ -69,6 +79,19 @@ def analyze_skill_gaps(current_skills, job_requirements_dict):
     }
 
 
+def _role_skill_ids(job_requirements_dict):
+    """(required, nice-to-have) skill ID sets, reusing a catalog role's precomputed ones"""
+    required_ids = getattr(job_requirements_dict, 'required_ids', None)
+    nice_ids = getattr(job_requirements_dict, 'nice_ids', None)
+    
+    if required_ids is None:
+        required_ids = REGISTRY.ids(job_requirements_dict.get('required_skills', []))
+    if nice_ids is None:
+        nice_ids = REGISTRY.ids(job_requirements_dict.get('nice_to_have', []))
+    
+    return required_ids, nice_ids
+
+
 def calculate_match_score(current_skills, job_requirements_dict):
     """
     Calculate how well current skills match job requirements
@@ -80,25 +103,116 @@ def calculate_match_score(current_skills, job_requirements_dict):
     Returns:
         Dictionary with match percentage and counts
     """
-    user_set = set(s.lower().strip() for s in current_skills if s)
-    required_skills = job_requirements_dict.get('required_skills', [])
-    job_set = set(s.lower().strip() for s in required_skills if s)
+    user_ids = REGISTRY.ids(current_skills)
+    job_ids, _ = _role_skill_ids(job_requirements_dict)
     
-    matching_skills = user_set & job_set
+    matching_skills = user_ids & job_ids
     
-    if len(job_set) == 0:
+    if len(job_ids) == 0:
         match_percentage = 0
     else:
-        match_percentage = (len(matching_skills) / len(job_set)) * 100
+        match_percentage = (len(matching_skills) / len(job_ids)) * 100
     
     return {
         'match_percentage': round(match_percentage, 1),
         'matching_count': len(matching_skills),
-        'total_required': len(job_set),
-        'gap_count': len(job_set - user_set)
+        'total_required': len(job_ids),
+        'gap_count': len(job_ids - user_ids)
     }
 
 
+def _role_weights(job_requirements_dict):
+    """Compiled demand weights, reusing a catalog role's precomputed ones"""
+    weights = getattr(job_requirements_dict, 'weights', None)
+    if weights is None:
+        required_ids, _ = _role_skill_ids(job_requirements_dict)
+        weights = RoleWeights(
+            required_ids,
+            job_requirements_dict.get('skill_weights'),
+            job_requirements_dict.get('skill_frequency')
+        )
+    return weights
+
+
+def calculate_weighted_match_score(current_skills, job_requirements_dict):
+    """
+    Demand-weighted version of calculate_match_score()
+    
+    Each required skill counts with its role weight (hand-configured or its
+    posting share), so missing a rarely asked-for skill costs less than
+    missing a core one. With no weights configured it equals the unweighted score.
+    
+    Args:
+        current_skills: List of user's current skills
+        job_requirements_dict: Catalog role or dict with 'required_skills'
+            (and optionally 'skill_weights' / 'skill_frequency')
+        
+    Returns:
+        calculate_match_score() dict plus weighted_match_percentage,
+        matched_weight and total_weight
+    """
+    user_ids = REGISTRY.ids(current_skills)
+    weights = _role_weights(job_requirements_dict)
+    by_id = weights.by_id
+    
+    matched_weight = 0.0
+    matching_count = 0
+    for skill_id in user_ids:
+        weight = by_id.get(skill_id)
+        if weight is not None:
+            matched_weight += weight
+            matching_count += 1
+    
+    total_required = len(by_id)
+    return {
+        'weighted_match_percentage': round(matched_weight / weights.total * 100, 1) if weights.total else 0,
+        'match_percentage': round(matching_count / total_required * 100, 1) if total_required else 0,
+        'matching_count': matching_count,
+        'total_required': total_required,
+        'gap_count': total_required - matching_count,
+        'matched_weight': round(matched_weight, 4),
+        'total_weight': round(weights.total, 4)
+    }
+
+
+def rank_gaps_by_demand(current_skills, job_requirements_dict):
+    """
+    Missing required skills, most in-demand first
+    
+    Args:
+        current_skills: List of user's current skills
+        job_requirements_dict: Catalog role or dict with 'required_skills'
+        
+    Returns:
+        List of (canonical skill name, weight) pairs
+    """
+    user_ids = REGISTRY.ids(current_skills)
+    weights = _role_weights(job_requirements_dict)
+    return [
+        (REGISTRY.name(skill_id), weight)
+        for skill_id, weight in zip(weights.skill_ids, weights.weights)
+        if skill_id not in user_ids
+    ]
+
+
+def rank_roles(current_skills, top_k=5, catalog=None):
+    """
+    Suggest the best-fit roles for a user across the whole job catalog
+    
+    Args:
+        current_skills: List of user's current skills
+        top_k: Number of roles to return
+        catalog: Optional catalog.JobCatalog (default: the shared job catalog)
+        
+    Returns:
+        List of dicts with role, match_percentage, matching_count,
+        total_required and gap_count, best match first
+    """
+    catalog = catalog or get_job_catalog()
+    return catalog.rank_roles(current_skills, top_k=top_k)
+
+
+@metrics.timed("roadmap")
 def generate_roadmap(gaps_dict, time_per_day, current_level):
     """
     Generate a 7-day personalized learning roadmap based on skill gaps
@@ -109,8 +223,17 @@ def generate_roadmap(gaps_dict, time_per_day, current_level):
         current_level: 'Beginner' or 'Intermediate'
         
     Returns:
-        Dictionary with daily roadmap structure
+        Dictionary with daily roadmap structure. Skills are ordered so
+        prerequisites come first (skill_prerequisites.json) and packed into
+        days by estimated hours; days list their per-skill 'skill_hours' and
+        'remaining_skills' holds what did not fit into the week.
+        
+    Raises:
+        ValueError: when time_per_day is not positive
     """
+    if not time_per_day or time_per_day <= 0:
+        raise ValueError(f"time_per_day must be a positive number of hours, got {time_per_day!r}")
+    
     # Prioritize required skills over nice-to-have
     required_gaps = gaps_dict.get('missing_required', [])
     nice_gaps = gaps_dict.get('missing_nice_to_have', [])
@@ -134,32 +257,38 @@ def generate_roadmap(gaps_dict, time_per_day, current_level):
         'Intermediate': {
             'platform': 'Udemy, Coursera, Official Documentation',
             'approach': 'Advanced courses and real-world projects'
+        },
+        'Advanced': {
+            'platform': 'Official Documentation, Engineering Blogs, Open Source',
+            'approach': 'Deep dives, production-grade projects and contributions'
         }
     }
     
-    # Distribute skills across 7 days based on time commitment
-    if time_per_day >= 3:
-        skills_per_day = max(1, len(priority_skills) // 5)  # Faster pace
-    else:
-        skills_per_day = max(1, len(priority_skills) // 7)
+    # Prerequisites first, then pack each day up to time_per_day hours by effort estimate
+    graph = get_prerequisite_graph()
+    spelling = {}
+    for skill in priority_skills:
+        if skill:
+            spelling.setdefault(REGISTRY.skill_id(skill), skill)
+    ordered = [spelling[skill_id] for skill_id in graph.order(spelling)]
+    efforts = [graph.hours(REGISTRY.skill_id(skill), current_level) for skill in ordered]
     
     roadmap = {
         "level": current_level,
         "time_per_day": time_per_day,
-        "total_skills": len(priority_skills),
+        "total_skills": len(ordered),
         "required_count": len(required_gaps),
         "nice_to_have_count": len(nice_gaps),
         "recommended_platform": resources[current_level]['platform'],
         "learning_approach": resources[current_level]['approach'],
+        "estimated_hours": sum(efforts),
         "days": []
     }
     
-    # Create daily plan
+    next_skill = 0
+    carried = 0.0  # Hours of ordered[next_skill] already done on earlier days
     for day in range(1, 8):
-        start_idx = (day - 1) * skills_per_day
-        end_idx = min(start_idx + skills_per_day, len(priority_skills))
-        
-        if start_idx >= len(priority_skills):
+        if next_skill >= len(ordered):
             # Review and project days
             day_plan = {
                 "day": day,
@@ -174,14 +303,27 @@ def generate_roadmap(gaps_dict, time_per_day, current_level):
                 ],
                 "resources": "LeetCode, HackerRank, GitHub, Portfolio Templates",
                 "hours": time_per_day,
-                "project_ideas": generate_project_ideas(priority_skills[:start_idx])
+                "project_ideas": generate_project_ideas(ordered)
             }
         else:
-            day_skills = priority_skills[start_idx:end_idx]
+            # Split a skill across days when it does not fit in what is left of today
+            day_skills, skill_hours = [], {}
+            left = float(time_per_day)
+            while left > 0 and next_skill < len(ordered):
+                skill = ordered[next_skill]
+                spent = min(left, efforts[next_skill] - carried)
+                day_skills.append(skill)
+                skill_hours[skill] = spent
+                left -= spent
+                carried += spent
+                if carried >= efforts[next_skill] - 1e-9:  # Float drift from fractional hours
+                    next_skill, carried = next_skill + 1, 0.0
+            
             day_plan = {
                 "day": day,
                 "focus": " + ".join([s.title() for s in day_skills]),
                 "skills": day_skills,
+                "skill_hours": skill_hours,
                 "is_review_day": False,
                 "activities": generate_daily_activities(day_skills, current_level),
                 "resources": generate_resources(day_skills, current_level),
@@ -191,62 +333,165 @@ def generate_roadmap(gaps_dict, time_per_day, current_level):
         
         roadmap["days"].append(day_plan)
     
+    # Skills that did not fit into the week, still in prerequisite order
+    roadmap["remaining_skills"] = ordered[next_skill:]
+    
     return roadmap
 
 
-def generate_daily_activities(skills, level):
-    """Generate specific activities for skills based on level"""
-    activities = []
+# -------------------------------
+# 👥 Batch Roadmaps for Cohorts
+# -------------------------------
+
+ROADMAP_CACHE_SIZE = 1024
+
+
+class FrozenDict(dict):
+    """Read-only dict: safe to share one roadmap between many students, still JSON-serializable"""
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared roadmap objects are read-only")
+    
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _readonly
     
-    for skill in skills:
-        skill_lower = skill.lower()
+    def __reduce__(self):
+        # Rebuild through the constructor: pickle would otherwise replay items via __setitem__
+        return (FrozenDict, (dict(self),))
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _freeze(value):
+    """Recursively turn dicts into FrozenDicts and lists into tuples"""
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=ROADMAP_CACHE_SIZE)
+def _cached_roadmap(required_ids, nice_ids, time_per_day, current_level):
+    gaps_dict = {
+        'missing_required': REGISTRY.names(required_ids),
+        'missing_nice_to_have': REGISTRY.names(nice_ids)
+    }
+    return _freeze(generate_roadmap(gaps_dict, time_per_day, current_level))
+
+
+def generate_roadmaps_batch(gaps_list, time_per_day, current_level):
+    """
+    Generate roadmaps for a whole cohort, computing each distinct one once
+    
+    Students with the same gap sets share one roadmap object, whatever order
+    or spelling their gaps are listed in (analyze_skill_gaps() lists them in
+    no particular order anyway). Unique roadmaps are kept in a bounded LRU,
+    so repeated cohort runs reuse them as well. The returned roadmaps are
+    read-only (FrozenDict / tuples).
+    
+    Args:
+        gaps_list: List of dicts from analyze_skill_gaps(), one per student
+        time_per_day: Hours available per day (1-4)
+        current_level: 'Beginner', 'Intermediate' or 'Advanced'
         
-        if level == 'Beginner':
-            if 'python' in skill_lower:
-                activities.append("📚 Learn Python basics: variables, loops, functions, lists")
-            elif 'java' in skill_lower:
-                activities.append("📚 Study Java fundamentals: OOP, classes, methods")
-            elif 'react' in skill_lower:
-                activities.append("📚 Learn React basics: components, props, state, JSX")
-            elif 'sql' in skill_lower:
-                activities.append("📚 Practice SQL: SELECT, WHERE, JOIN operations")
-            elif 'docker' in skill_lower:
-                activities.append("📚 Understand Docker basics: containers, images, dockerfile")
-            elif 'git' in skill_lower:
-                activities.append("📚 Master Git basics: commit, push, pull, branches")
-            elif 'spring boot' in skill_lower:
-                activities.append("📚 Intro to Spring Boot: annotations, REST controllers")
-            elif 'tensorflow' in skill_lower or 'machine learning' in skill_lower:
-                activities.append("📚 ML basics: supervised learning, model training")
-            elif 'node' in skill_lower:
-                activities.append("📚 Node.js fundamentals: modules, npm, async/await")
-            elif 'rest api' in skill_lower:
-                activities.append("📚 Learn REST API concepts: GET, POST, PUT, DELETE")
-            else:
-                activities.append(f"📚 Study {skill.title()} fundamentals and core concepts")
-        else:  # Intermediate
-            if 'python' in skill_lower:
-                activities.append("🚀 Build Python project: web scraper or automation tool")
-            elif 'java' in skill_lower:
-                activities.append("🚀 Create Java application with design patterns")
-            elif 'react' in skill_lower:
-                activities.append("🚀 Build React app with hooks, routing, and API integration")
-            elif 'sql' in skill_lower:
-                activities.append("🚀 Design database schema and optimize queries")
-            elif 'docker' in skill_lower:
-                activities.append("🚀 Containerize app with Docker Compose and multi-stage builds")
-            elif 'git' in skill_lower:
-                activities.append("🚀 Practice advanced Git: merge, rebase, conflict resolution")
-            elif 'spring boot' in skill_lower:
-                activities.append("🚀 Build REST API with Spring Boot and JPA")
-            elif 'tensorflow' in skill_lower or 'machine learning' in skill_lower:
-                activities.append("🚀 Train ML model and deploy it")
-            elif 'node' in skill_lower:
-                activities.append("🚀 Build Express.js backend with authentication")
-            elif 'rest api' in skill_lower:
-                activities.append("🚀 Design and implement RESTful API with best practices")
-            else:
-                activities.append(f"🚀 Build hands-on project using {skill.title()}")
+    Returns:
+        Dict with 'roadmaps' (aligned with gaps_list) and a 'report' of
+        total, unique and deduplicated roadmap counts plus LRU hits
+    """
+    hits_before = _cached_roadmap.cache_info().hits
+    
+    roadmaps = []
+    unique_keys = set()
+    for gaps_dict in gaps_list:
+        key = (
+            tuple(sorted(REGISTRY.ids(gaps_dict.get('missing_required', [])))),
+            tuple(sorted(REGISTRY.ids(gaps_dict.get('missing_nice_to_have', [])))),
+            time_per_day,
+            current_level
+        )
+        unique_keys.add(key)
+        roadmaps.append(_cached_roadmap(*key))
+    
+    return {
+        'roadmaps': roadmaps,
+        'report': {
+            'total': len(gaps_list),
+            'unique': len(unique_keys),
+            'deduplicated': len(gaps_list) - len(unique_keys),
+            'cache_hits': _cached_roadmap.cache_info().hits - hits_before
+        }
+    }
+
+
+# -------------------------------
+# 📚 Roadmap Content Tables
+# -------------------------------
+
+ROADMAP_CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "roadmap_content.json")
+
+_roadmap_tables = None
+
+
+def load_roadmap_content(path=ROADMAP_CONTENT_PATH):
+    """
+    Compile the per-skill activities/resources file into direct lookup tables
+    
+    Args:
+        path: JSON content file with 'entries', 'default' and 'level_fallback'
+        
+    Returns:
+        Dict with 'content' ((skill ID, level) -> (activity, resource)),
+        'default' (level -> (activity template, resource template)),
+        'levels' (level -> table level)
+    """
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    
+    default = {
+        level: (texts["activity"], texts["resource"])
+        for level, texts in document["default"].items()
+    }
+    levels = {level: level for level in default}
+    levels.update(document.get("level_fallback", {}))
+    
+    content = {}
+    for entry in document["entries"]:
+        for skill_id in REGISTRY.ids(entry["skills"]):
+            for level in default:
+                texts = entry.get(level)
+                if texts:
+                    content[(skill_id, level)] = (texts["activity"], texts["resource"])
+    
+    return {"content": content, "default": default, "levels": levels}
+
+
+def _roadmap_content():
+    """Compiled content tables, built on first use and reused by every call"""
+    global _roadmap_tables
+    if _roadmap_tables is None:
+        _roadmap_tables = load_roadmap_content()
+    return _roadmap_tables
+
+
+def _skill_content(skill, level, tables):
+    """(activity, resource) for one skill: one lookup keyed by canonical skill and level"""
+    table_level = tables["levels"].get(level, "Intermediate")
+    found = tables["content"].get((REGISTRY.skill_id(skill), table_level))
+    if found:
+        return found
+    activity, resource = tables["default"][table_level]
+    name = skill.title()
+    return activity.format(skill=name), resource.format(skill=name)
+
+
+def generate_daily_activities(skills, level):
+    """Generate specific activities for skills based on level"""
+    tables = _roadmap_content()
+    activities = [_skill_content(skill, level, tables)[0] for skill in skills]
     
     # Add practice activity
     activities.append("💪 Complete 2-3 coding exercises related to today's skills")
@@ -256,47 +501,22 @@ def generate_daily_activities(skills, level):
 
 def generate_resources(skills, level):
     """Generate learning resources for specific skills"""
-    resources = []
-    
-    for skill in skills:
-        skill_lower = skill.lower()
-        
-        if 'python' in skill_lower:
-            resources.append("Python.org" if level == 'Beginner' else "Real Python, Python Docs")
-        elif 'java' in skill_lower:
-            resources.append("Java Tutorial (Oracle)" if level == 'Beginner' else "Effective Java, Spring Guides")
-        elif 'react' in skill_lower:
-            resources.append("React.dev Tutorial" if level == 'Beginner' else "React Docs, React Patterns")
-        elif 'sql' in skill_lower:
-            resources.append("SQLBolt, W3Schools" if level == 'Beginner' else "PostgreSQL Docs, SQL Performance")
-        elif 'docker' in skill_lower:
-            resources.append("Docker Getting Started" if level == 'Beginner' else "Docker Docs, Docker Compose")
-        elif 'node' in skill_lower:
-            resources.append("NodeSchool.io" if level == 'Beginner' else "Node.js Docs, Express.js Guide")
-        elif 'spring boot' in skill_lower:
-            resources.append("Spring.io Guides" if level == 'Beginner' else "Spring Boot Reference, Baeldung")
-        elif 'machine learning' in skill_lower or 'tensorflow' in skill_lower:
-            resources.append("Kaggle Learn, TensorFlow Basics" if level == 'Beginner' else "TensorFlow Docs, Fast.ai")
-        elif 'git' in skill_lower:
-            resources.append("GitHub Skills" if level == 'Beginner' else "Pro Git Book, Atlassian Git")
-        elif 'rest api' in skill_lower:
-            resources.append("REST API Tutorial" if level == 'Beginner' else "RESTful Web Services, API Design")
-        else:
-            resources.append(f"{skill.title()} Official Documentation")
+    tables = _roadmap_content()
+    resources = [_skill_content(skill, level, tables)[1] for skill in skills]
     
     return ", ".join(resources) if resources else "Online tutorials and official docs"
 
 
 def generate_project_ideas(learned_skills):
     """Generate project ideas based on learned skills"""
-    skill_set = set(s.lower() for s in learned_skills)
+    skill_set = set(REGISTRY.canonical(s) for s in learned_skills if s)
     
     projects = []
     
     if 'java' in skill_set and 'spring boot' in skill_set:
         projects.append("Build a Task Management REST API with Spring Boot")
     
-    if 'react' in skill_set and 'node' in skill_set:
+    if 'react' in skill_set and 'node.js' in skill_set:
         projects.append("Create a Full-stack Todo App (MERN stack)")
     
     if 'python' in skill_set and 'sql' in skill_set:
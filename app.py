@@ -1,8 +1,14 @@
 import streamlit as st
-import json
-import time
+import hashlib
 from datetime import datetime, timedelta
 
+import data
+from agents import calculate_match_score, rank_gaps_by_demand
+from catalog import get_job_catalog
+from pipeline import build_navigator_pipeline
+from prerequisites import get_prerequisite_graph
+from skills import REGISTRY
+
 # Page config
 st.set_page_config(
     page_title="Career Navigator",
@@ -232,20 +238,42 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Mock data functions
-def analyze_github(username):
-    return {"languages": ["Python", "JavaScript", "TypeScript"], "projects": 12, "commits": 347, "stars": 89}
+# -------------------------------
+# Pipeline with caching layers
+# -------------------------------
 
-def parse_resume(file):
-    return {"skills": ["React", "Python", "SQL", "Docker"], "experience": "2 years", "education": "B.Tech CS"}
+@st.cache_resource
+def get_catalog():
+    """Job catalog, loaded once per server process"""
+    return get_job_catalog()
+
+
+@st.cache_resource
+def get_http_session():
+    """Pooled keep-alive session shared by every GitHub fetch"""
+    return data.create_github_session()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_github_profile(username):
+    """GitHub skills, cached per username for 10 minutes"""
+    return data.get_github_skills(username, session=get_http_session())
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def parse_resume(file_hash, _content):
+    """Parsed resume, cached by the SHA-256 of the uploaded bytes"""
+    return data.extract_resume_skills(_content)
+
+
+@st.cache_resource
+def get_pipeline():
+    """Memoized stage graph: moving only the sliders re-runs just the roadmap stage"""
+    return build_navigator_pipeline(
+        fetch_github=fetch_github_profile,
+        parse_resume=lambda content: parse_resume(hashlib.sha256(content).hexdigest(), content) if content else None
+    )
 
-def get_role_skills(role):
-    skills_db = {
-        'Software Engineer': ['Python', 'Java', 'Git', 'Docker', 'Kubernetes', 'APIs', 'System Design'],
-        'Data Scientist': ['Python', 'SQL', 'Machine Learning', 'Statistics', 'Pandas', 'TensorFlow', 'Visualization'],
-        'Fullstack Developer': ['React', 'Node.js', 'MongoDB', 'REST APIs', 'CSS', 'TypeScript', 'GraphQL']
-    }
-    return skills_db.get(role, [])
 
 # Hero Section
 st.markdown('<h1 class="hero-title">Personal Career Navigator 🚀</h1>', unsafe_allow_html=True)
@@ -259,7 +287,7 @@ with st.sidebar:
     
     github_username = st.text_input("🔗 GitHub Username", placeholder="yourusername")
     resume_file = st.file_uploader("📄 Upload Resume (PDF)", type=['pdf'])
-    dream_role = st.selectbox("💼 Dream Role", ['Software Engineer', 'Data Scientist', 'Fullstack Developer'])
+    dream_role = st.selectbox("💼 Dream Role", get_catalog().roles())
     hours_per_day = st.slider("⏰ Hours/Day", 1, 4, 2)
     level = st.selectbox("📊 Current Level", ['Beginner', 'Intermediate', 'Advanced'])
     
@@ -272,24 +300,44 @@ if analyze_button:
         st.error("⚠️ Please enter your GitHub username to continue")
     else:
         with st.spinner("🔮 AI is analyzing your career trajectory..."):
-            time.sleep(2.5)
+            results = get_pipeline().run(
+                github_user=github_username.strip(),
+                resume_bytes=resume_file.getvalue() if resume_file else None,
+                role=dream_role,
+                hours=hours_per_day,
+                level=level
+            )
+            github_data = results["github"]
+            resume_data = results["resume"]
+            user_skills = results["skills"]
+            gaps = results["gaps"]
+            roadmap = results["roadmap"]
+            
+            role_requirements = get_catalog().get(dream_role)
+            score = calculate_match_score(user_skills, role_requirements)
+        
+        if github_data is None:
+            st.warning(f"⚠️ GitHub user '{github_username}' not found. Showing resume-only analysis.")
+        elif data.is_deferred(github_data):
+            # Don't keep the placeholder for 10 minutes; the next click fetches again
+            fetch_github_profile.clear(github_username.strip())
+            st.warning(f"⏳ GitHub rate limit reached. Try again in about {github_data['retry_after']}s. Showing resume-only analysis.")
         
         st.success("✨ Analysis Complete! Your personalized roadmap is ready.")
         st.markdown("<br>", unsafe_allow_html=True)
         
         # Metrics Row
-        github_data = analyze_github(github_username)
-        resume_data = parse_resume(resume_file) if resume_file else {"skills": ["Git", "Python", "React"], "experience": "1 year"}
+        repos_count = github_data["repos_count"] if github_data else 0
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.markdown(f'<div class="metric-card"><div class="metric-value">{len(resume_data["skills"])}</div><div class="metric-label">Skills</div></div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="metric-card"><div class="metric-value">{len(user_skills)}</div><div class="metric-label">Skills</div></div>', unsafe_allow_html=True)
         with col2:
-            st.markdown(f'<div class="metric-card"><div class="metric-value">{github_data["projects"]}</div><div class="metric-label">Projects</div></div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="metric-card"><div class="metric-value">{repos_count}</div><div class="metric-label">Repos</div></div>', unsafe_allow_html=True)
         with col3:
-            st.markdown(f'<div class="metric-card"><div class="metric-value">{github_data["commits"]}</div><div class="metric-label">Commits</div></div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="metric-card"><div class="metric-value">{score["match_percentage"]:.0f}%</div><div class="metric-label">Match</div></div>', unsafe_allow_html=True)
         with col4:
-            st.markdown(f'<div class="metric-card"><div class="metric-value">{github_data["stars"]}</div><div class="metric-label">Stars</div></div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="metric-card"><div class="metric-value">{score["gap_count"]}</div><div class="metric-label">Gaps</div></div>', unsafe_allow_html=True)
         
         st.markdown("<br>", unsafe_allow_html=True)
         
@@ -299,6 +347,7 @@ if analyze_button:
         profile_data = {
             "github_insights": github_data,
             "resume_summary": resume_data,
+            "all_skills": sorted(user_skills),
             "skill_level": level,
             "learning_capacity": f"{hours_per_day} hours/day"
         }
@@ -308,19 +357,27 @@ if analyze_button:
         # Role Skills Card
         st.markdown('<div class="glass-card">', unsafe_allow_html=True)
         st.markdown("### 💼 Dream Role Requirements")
-        role_skills = get_role_skills(dream_role)
-        st.table({"Required Skills": role_skills, "Priority": ["High"] * len(role_skills)})
+        required = role_requirements["required_skills"]
+        nice_to_have = role_requirements["nice_to_have"]
+        st.table({
+            "Skill": [*required, *nice_to_have],
+            "Priority": ["High"] * len(required) + ["Nice to have"] * len(nice_to_have)
+        })
         st.markdown('</div>', unsafe_allow_html=True)
         
-        # Skill Gaps Card
-        user_skills = set(resume_data["skills"])
-        required_skills = set(role_skills)
-        gaps = list(required_skills - user_skills)
+        # Skill Gaps Card (most in-demand first)
+        missing = rank_gaps_by_demand(user_skills, role_requirements)
+        effort = get_prerequisite_graph()
+        top_weight = max((weight for _, weight in missing), default=0)
         
-        if gaps:
+        if missing:
             st.markdown('<div class="gap-card">', unsafe_allow_html=True)
-            st.markdown(f"### ⚠️ Skill Gaps Identified: {len(gaps)}")
-            st.table({"Missing Skill": gaps, "Impact": ["Critical"] * len(gaps), "Est. Time": [f"{hours_per_day*3}hrs"] * len(gaps)})
+            st.markdown(f"### ⚠️ Skill Gaps Identified: {len(missing)}")
+            st.table({
+                "Missing Skill": [s.title() for s, _ in missing],
+                "Impact": ["Critical" if weight >= 0.75 * top_weight else "Moderate" for _, weight in missing],
+                "Est. Time": [f"{effort.hours(REGISTRY.skill_id(s), level):g}hrs" for s, _ in missing]
+            })
             st.markdown('</div>', unsafe_allow_html=True)
         else:
             st.markdown('<div class="glass-card">', unsafe_allow_html=True)
@@ -332,17 +389,29 @@ if analyze_button:
         st.markdown('<div class="glass-card">', unsafe_allow_html=True)
         st.markdown("### 🗺️ 7-Day Personalized Roadmap")
         
-        for i, skill in enumerate(gaps[:7] if gaps else ["Advanced Topics"]):
-            day_name = (datetime.now() + timedelta(days=i+1)).strftime("%A")
+        if not roadmap["days"]:
+            st.write(f'{roadmap["message"]} {roadmap["suggestion"]}')
+        
+        for day_plan in roadmap["days"]:
+            day_name = (datetime.now() + timedelta(days=day_plan["day"])).strftime("%A")
+            activities = "<br>".join(day_plan["activities"])
             st.markdown(f'''
             <div class="roadmap-item">
-                <strong>Day {i+1} • {day_name}</strong><br>
-                🎯 Master {skill}<br>
-                ⏱️ {hours_per_day} hours • {level} level content
+                <strong>Day {day_plan["day"]} • {day_name}</strong><br>
+                🎯 {day_plan["focus"]}<br>
+                {activities}<br>
+                📚 {day_plan["resources"]}<br>
+                ⏱️ {day_plan["hours"]} hours • {level} level content
             </div>
             ''', unsafe_allow_html=True)
-        
+
+        if roadmap.get("remaining_skills"):
+            st.caption("⏭️ Next week: " + ", ".join(s.title() for s in roadmap["remaining_skills"]))
+
         st.markdown('</div>', unsafe_allow_html=True)
+
+        with st.expander("⚙️ Pipeline stage cache"):
+            st.table(get_pipeline().stats())
         
         st.balloons()
 
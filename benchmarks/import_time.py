@@ -0,0 +1,97 @@
+# ⏱️ CAREER NAVIGATOR - Cold Import Time Benchmark
+# Tracks `python -X importtime` cold-start cost of data.py and agents.py as a regression metric
+#
+# Usage:
+#   python benchmarks/import_time.py [--runs 7] [--save baseline.json] [--baseline baseline.json --threshold 0.25]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ["data", "agents"]
+
+
+def measure_import(module, runs=7):
+    """
+    Cold-import a module in fresh interpreters and read -X importtime output
+
+    Args:
+        module: Top-level module name
+        runs: Number of fresh interpreters to start
+
+    Returns:
+        Dict with median / min cumulative import time (ms) and bytes printed on import
+    """
+    timings = []
+    stdout_bytes = 0
+
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+
+        stdout_bytes = max(stdout_bytes, len(result.stdout.encode("utf-8")))
+        for line in result.stderr.splitlines():
+            # "import time:  self [us] | cumulative | imported package"
+            if not line.startswith("import time:"):
+                continue
+            fields = line[len("import time:"):].split("|")
+            if len(fields) == 3 and fields[2].rstrip() == f" {module}":
+                timings.append(int(fields[1]) / 1000)
+
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2),
+        "stdout_bytes": stdout_bytes
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark cold import time of the navigator modules")
+    parser.add_argument("--runs", type=int, default=7, help="Fresh interpreters per module")
+    parser.add_argument("--save", help="Write results as a JSON baseline")
+    parser.add_argument("--baseline", help="Compare against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    results = {module: measure_import(module, runs=args.runs) for module in MODULES}
+
+    print(f"{'module':<8} {'median ms':>10} {'min ms':>8} {'stdout':>7}")
+    for module, result in results.items():
+        print(f"{module:<8} {result['median_ms']:>10} {result['min_ms']:>8} {result['stdout_bytes']:>7}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Baseline saved to {args.save}")
+
+    failed = False
+    for module, result in results.items():
+        if result["stdout_bytes"]:
+            print(f"❌ import {module} printed to stdout")
+            failed = True
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        for module, result in results.items():
+            if module not in baseline:
+                continue
+            limit = baseline[module]["median_ms"] * (1 + args.threshold)
+            if result["median_ms"] > limit:
+                print(f"❌ {module}: {result['median_ms']} ms > {limit:.2f} ms allowed")
+                failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+# ⏱️ CAREER NAVIGATOR - PDF Backend Benchmark
+# Compare text extraction speed of every installed PDF backend on a folder of resumes
+#
+# Usage:
+#   python benchmarks/pdf_backends.py path/to/resumes [--repeat 3] [--backend pymupdf]
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data  # noqa: E402
+
+
+def benchmark_backend(backend, pdf_paths, repeat=1):
+    """
+    Extract every page of every PDF with one backend
+
+    Args:
+        backend: Backend name from data.PDF_BACKENDS
+        pdf_paths: List of PDF file paths
+        repeat: How many times to run over the whole folder
+
+    Returns:
+        Dict with pages, total seconds, pages/sec and failures
+    """
+    pages = 0
+    failures = 0
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        for path in pdf_paths:
+            try:
+                for _text in data.PDF_BACKENDS[backend](path):
+                    pages += 1
+            except Exception as e:
+                failures += 1
+                print(f"⚠️  {backend} failed on {os.path.basename(path)}: {e}")
+
+    elapsed = time.perf_counter() - start
+    return {
+        "backend": backend,
+        "files": len(pdf_paths) * repeat,
+        "pages": pages,
+        "total_seconds": round(elapsed, 4),
+        "pages_per_sec": round(pages / elapsed, 1) if elapsed > 0 else 0.0,
+        "failures": failures
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark PDF text extraction backends")
+    parser.add_argument("folder", help="Folder containing PDF resumes")
+    parser.add_argument("--repeat", type=int, default=1, help="Passes over the folder per backend")
+    parser.add_argument("--backend", action="append", choices=list(data.PDF_BACKENDS),
+                        help="Backend to benchmark (repeatable, default: all installed)")
+    args = parser.parse_args(argv)
+
+    pdf_paths = sorted(glob.glob(os.path.join(args.folder, "*.pdf")))
+    if not pdf_paths:
+        print(f"❌ No PDF files found in {args.folder}")
+        return 1
+
+    backends = args.backend or data.available_pdf_backends()
+    if not backends:
+        print("❌ No PDF backend installed. Install with: pip install PyMuPDF PyPDF2")
+        return 1
+
+    print(f"📄 {len(pdf_paths)} PDFs x {args.repeat} pass(es)\n")
+    print(f"{'backend':<10} {'pages':>8} {'total s':>10} {'pages/s':>10} {'failures':>9}")
+    for backend in backends:
+        result = benchmark_backend(backend, pdf_paths, repeat=args.repeat)
+        print(f"{result['backend']:<10} {result['pages']:>8} {result['total_seconds']:>10} "
+              f"{result['pages_per_sec']:>10} {result['failures']:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
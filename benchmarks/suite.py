@@ -0,0 +1,249 @@
+# ⏱️ CAREER NAVIGATOR - Microbenchmark Suite
+# Times every hot function of data.py and agents.py at small / medium / large scale
+#
+# Usage:
+#   python benchmarks/suite.py                          # run and print
+#   python benchmarks/suite.py --save baseline.json     # record a baseline
+#   python benchmarks/suite.py --baseline baseline.json --threshold 0.2
+#   python benchmarks/suite.py --only analyze_skill_gaps --scale large
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import agents  # noqa: E402
+import data  # noqa: E402
+from catalog import JobRole  # noqa: E402
+from github_standin import StandInConfig, running_standin  # noqa: E402
+
+SCALES = ["small", "medium", "large"]
+
+# -------------------------------
+# Synthetic data generators
+# -------------------------------
+
+def make_skills(count, rng, prefix="Skill"):
+    """Skill names: real catalog skills first, then synthetic ones"""
+    real = sorted({s for role in data.load_job_requirements().values() for s in role["required_skills"]})
+    real += ["HTML", "CSS", "Git", "Linux", "Kubernetes", "Redis", "GraphQL", "AWS"]
+    rng.shuffle(real)
+    synthetic = [f"{prefix} {i}" for i in range(max(0, count - len(real)))]
+    return (real + synthetic)[:count]
+
+
+def make_role(required, nice, rng):
+    return {
+        "required_skills": make_skills(required, rng, prefix="Required"),
+        "nice_to_have": make_skills(nice, rng, prefix="Nice"),
+        "experience": "0-2 years"
+    }
+
+
+def make_profiles(count, rng):
+    """(github_data, resume_data) pair holding about `count` skills in total"""
+    skills = make_skills(count, rng)
+    half = len(skills) // 2
+    github_data = {"skills": skills[:half]}
+    resume_data = {"technical_skills": {
+        "languages": skills[half:half + half // 2],
+        "tools": skills[half + half // 2:]
+    }}
+    return github_data, resume_data
+
+
+def make_resume_pdf(pages, rng):
+    """A generated resume PDF with the given number of pages (needs PyMuPDF)"""
+    pymupdf = data._pymupdf()
+    if pymupdf is None:
+        return None
+
+    vocabulary = [kw for keywords in data.DEFAULT_MATCHER.categories.values() for kw in keywords]
+    filler = "worked on distributed systems and delivered features end to end".split()
+    doc = pymupdf.open()
+    for number in range(pages):
+        page = doc.new_page()
+        lines = ["Jane Doe", "B.Tech CSE (AI & ML) CGPA: 9.1", "Technical Skills"] if number == 0 else []
+        for _ in range(40):
+            words = rng.sample(filler, 6) + rng.sample(vocabulary, 2)
+            rng.shuffle(words)
+            lines.append(" ".join(words))
+        page.insert_text((40, 40), "\n".join(lines), fontsize=9)
+    return doc.tobytes()
+
+
+# -------------------------------
+# Benchmark cases
+# -------------------------------
+
+def case_extract_resume_skills(scale, rng):
+    pages = {"small": 1, "medium": 5, "large": 30}[scale]
+    pdf = make_resume_pdf(pages, rng)
+    if pdf is None:
+        return None
+    return lambda: data.extract_resume_skills(pdf)
+
+
+def case_extract_all_skills_from_data(scale, rng):
+    github_data, resume_data = make_profiles({"small": 10, "medium": 100, "large": 1000}[scale], rng)
+    return lambda: agents.extract_all_skills_from_data(github_data, resume_data)
+
+
+def _skills_and_role(scale, rng):
+    user_count, required, nice = {"small": (10, 10, 4), "medium": (100, 50, 20), "large": (1000, 200, 50)}[scale]
+    return make_skills(user_count, rng), make_role(required, nice, rng)
+
+
+def case_analyze_skill_gaps(scale, rng):
+    skills, role = _skills_and_role(scale, rng)
+    return lambda: agents.analyze_skill_gaps(skills, role)
+
+
+def case_calculate_match_score(scale, rng):
+    skills, role = _skills_and_role(scale, rng)
+    return lambda: agents.calculate_match_score(skills, role)
+
+
+def case_calculate_weighted_match_score(scale, rng):
+    skills, role = _skills_and_role(scale, rng)
+    role["skill_frequency"] = {skill: rng.random() for skill in role["required_skills"]}
+    role = JobRole("Bench Role", **role)
+    return lambda: agents.calculate_weighted_match_score(skills, role)
+
+
+def case_generate_roadmap(scale, rng):
+    count = {"small": 5, "medium": 20, "large": 100}[scale]
+    gaps = {
+        "missing_required": make_skills(count, rng, prefix="Gap"),
+        "missing_nice_to_have": make_skills(count // 4, rng, prefix="Extra")
+    }
+    return lambda: agents.generate_roadmap(gaps, 2, "Beginner")
+
+
+def case_get_github_skills(scale, rng):
+    repos = {"small": 10, "medium": 100, "large": 1000}[scale]
+    session = data.create_github_session()
+    if session is None:
+        return None
+    # "synthetic-N" users are generated by the local stand-in with N repos
+    return (
+        lambda: data.get_github_skills(f"synthetic-{repos}", session=session),
+        lambda: running_standin(StandInConfig(rate_limit=10 ** 9))
+    )
+
+
+CASES = {
+    "extract_resume_skills": case_extract_resume_skills,
+    "extract_all_skills_from_data": case_extract_all_skills_from_data,
+    "analyze_skill_gaps": case_analyze_skill_gaps,
+    "calculate_match_score": case_calculate_match_score,
+    "calculate_weighted_match_score": case_calculate_weighted_match_score,
+    "generate_roadmap": case_generate_roadmap,
+    "get_github_skills": case_get_github_skills
+}
+
+
+def time_call(func, min_time=0.2, repeats=5):
+    """
+    Median per-call time of func in microseconds
+
+    Calls are batched so each repeat runs for at least min_time seconds.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= min_time / repeats or number >= 1_000_000:
+            break
+        number *= 4
+
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return statistics.median(samples)
+
+
+def run_suite(only=None, scales=SCALES, seed=42):
+    """
+    Run every benchmark case at every scale
+
+    Returns:
+        Dict of case -> scale -> median microseconds per call
+    """
+    # Re-parsing and re-fetching is what we measure, so keep caches and rate limiting out of the way
+    data.configure_resume_cache(max_entries=0)
+    data.configure_github_scheduler(rate=10 ** 9, burst=10 ** 9)
+
+    results = {}
+    for name, factory in CASES.items():
+        if only and name not in only:
+            continue
+        for scale in scales:
+            rng = random.Random(seed)
+            case = factory(scale, rng)
+            if case is None:
+                print(f"⏭️  {name} [{scale}] skipped (dependency not installed)")
+                continue
+
+            func, environment = case if isinstance(case, tuple) else (case, contextlib.nullcontext)
+            with environment(), contextlib.redirect_stdout(io.StringIO()):
+                micros = time_call(func)
+            results.setdefault(name, {})[scale] = round(micros, 2)
+            print(f"{name:<30} {scale:<7} {micros:>14.2f} µs")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Names of (case, scale) pairs slower than baseline by more than threshold"""
+    regressions = []
+    for name, scales in results.items():
+        for scale, micros in scales.items():
+            reference = baseline.get(name, {}).get(scale)
+            if reference and micros > reference * (1 + threshold):
+                regressions.append((name, scale, reference, micros))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Microbenchmarks for data.py and agents.py")
+    parser.add_argument("--only", action="append", choices=list(CASES), help="Run only these cases")
+    parser.add_argument("--scale", action="append", choices=SCALES, help="Run only these scales")
+    parser.add_argument("--save", help="Write results as a JSON baseline")
+    parser.add_argument("--baseline", help="Compare against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed slowdown vs baseline (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(only=args.only, scales=args.scale or SCALES)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Baseline saved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, scale, reference, micros in regressions:
+            print(f"❌ {name} [{scale}]: {micros:.2f} µs vs {reference:.2f} µs baseline")
+        if regressions:
+            return 1
+        print(f"\n✅ No regressions above {args.threshold:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+# 📋 CAREER NAVIGATOR - Job Requirements Catalog
+# Load-once role catalog backed by a CSV or JSON file, reloaded only when the file changes
+
+import csv
+import heapq
+import json
+import os
+import threading
+from array import array
+
+from skills import REGISTRY, canonical_skill
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_roles.json")
+
+
+def normalize_skill(skill):
+    """Canonical comparison form of a skill name (lowercased, aliases resolved)"""
+    return canonical_skill(skill)
+
+
+class RoleWeights:
+    """
+    Demand weights of a role's required skills, compiled once
+
+    skill_ids is ordered by weight (heaviest first, then name) and weights is
+    the dense vector aligned with it, so weighted gap ranking is one ordered
+    pass and the weighted score one dict lookup per matched skill.
+    """
+
+    __slots__ = ("skill_ids", "weights", "by_id", "total")
+
+    def __init__(self, required_ids, skill_weights=None, skill_frequency=None):
+        """
+        Args:
+            required_ids: Interned IDs of the role's required skills
+            skill_weights: Optional hand-configured skill -> weight
+            skill_frequency: Optional skill -> share of postings listing it
+        """
+        configured = {REGISTRY.skill_id(skill): float(w) for skill, w in (skill_weights or {}).items()}
+        frequency = {REGISTRY.skill_id(skill): float(f) for skill, f in (skill_frequency or {}).items()}
+
+        by_id = {
+            skill_id: configured.get(skill_id, frequency.get(skill_id, 1.0))
+            for skill_id in required_ids
+        }
+        self.skill_ids = tuple(sorted(by_id, key=lambda i: (-by_id[i], REGISTRY.name(i))))
+        self.weights = array("d", (by_id[i] for i in self.skill_ids))
+        self.by_id = by_id
+        self.total = sum(self.weights)
+
+
+class JobRole(dict):
+    """
+    Role requirements dict with precomputed canonical skill sets
+
+    Behaves exactly like the dicts load_job_requirements() always returned
+    ('required_skills', 'nice_to_have', 'experience'), plus frozensets of
+    canonical names and of interned skill IDs that analyze_skill_gaps() /
+    calculate_match_score() use directly instead of re-normalising the lists
+    on every call, and the compiled demand weights of the required skills.
+    Shared between callers, so it is read-only: the skill lists are tuples and
+    item assignment raises TypeError (copy with dict(role) to edit).
+    """
+
+    def __init__(self, name, required_skills, nice_to_have=(), experience="0-2 years",
+                 skill_weights=None, skill_frequency=None):
+        super().__init__(
+            required_skills=tuple(required_skills),
+            nice_to_have=tuple(nice_to_have),
+            experience=experience
+        )
+        self.name = name
+        self._skill_weights = dict(skill_weights or {})
+        self._skill_frequency = dict(skill_frequency or {})
+        self.required_ids = frozenset(REGISTRY.ids(required_skills))
+        self.nice_ids = frozenset(REGISTRY.ids(nice_to_have))
+        self.required_set = frozenset(REGISTRY.names(self.required_ids))
+        self.nice_set = frozenset(REGISTRY.names(self.nice_ids))
+        self.weights = RoleWeights(self.required_ids, skill_weights, skill_frequency)
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("catalog roles are shared and read-only; copy with dict(role) to edit")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        # Rebuild through the constructor: pickle would otherwise replay items via __setitem__
+        return (JobRole, (self.name, self["required_skills"], self["nice_to_have"], self["experience"],
+                          self._skill_weights, self._skill_frequency))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class JobCatalog:
+    """
+    Role definitions loaded once from CSV or JSON
+
+    JSON: {"roles": [{"role", "required_skills", "nice_to_have", "experience",
+                      "skill_weights", "skill_frequency"}, ...]}
+    CSV:  role,required_skills[,nice_to_have][,experience][,skill_weights] with
+          comma-joined skill cells and "Skill:weight" pairs for skill_weights
+
+    Required skills weigh 1.0 unless a hand-configured skill_weights entry or a
+    skill_frequency (posting share, written by ingest_postings.py) says otherwise.
+    """
+
+    def __init__(self, path=DEFAULT_CATALOG_PATH):
+        self.path = path
+        self._roles = {}
+        self._postings = {}
+        self._mtime = None
+        self._lock = threading.Lock()
+        self._reload_if_changed()
+
+    def get(self, role, default=None):
+        """O(1) role lookup"""
+        self._reload_if_changed()
+        return self._roles.get(role, default)
+
+    def __getitem__(self, role):
+        self._reload_if_changed()
+        return self._roles[role]
+
+    def __contains__(self, role):
+        self._reload_if_changed()
+        return role in self._roles
+
+    def __len__(self):
+        self._reload_if_changed()
+        return len(self._roles)
+
+    def roles(self):
+        """Role names in file order"""
+        self._reload_if_changed()
+        return list(self._roles)
+
+    def as_dict(self):
+        """Role name -> JobRole mapping (the shape load_job_requirements() returns)"""
+        self._reload_if_changed()
+        return dict(self._roles)
+
+    def roles_requiring(self, skill):
+        """Names of the roles that list a skill as required (its posting list)"""
+        self._reload_if_changed()
+        return self._postings.get(normalize_skill(skill), ())
+
+    def rank_roles(self, user_skills, top_k=5):
+        """
+        Rank roles by how well the user's skills cover their required skills
+
+        Only the posting lists of the user's own skills are touched, so the cost
+        grows with the user's skills and their postings, not with the catalog size.
+        Roles sharing no required skill with the user are not returned.
+
+        Args:
+            user_skills: List of user's current skills
+            top_k: Number of roles to return
+
+        Returns:
+            List of dicts (role, match_percentage, matching_count, total_required,
+            gap_count), best match first
+        """
+        self._reload_if_changed()
+        roles, postings = self._roles, self._postings
+
+        matched = {}
+        for skill in set(normalize_skill(s) for s in user_skills if s):
+            for role_name in postings.get(skill, ()):
+                matched[role_name] = matched.get(role_name, 0) + 1
+
+        def sort_key(item):
+            role_name, count = item
+            return (-count / len(roles[role_name].required_set), -count, role_name)
+
+        best = heapq.nsmallest(top_k, matched.items(), key=sort_key)
+        results = []
+        for role_name, count in best:
+            total = len(roles[role_name].required_set)
+            results.append({
+                'role': role_name,
+                'match_percentage': round(count / total * 100, 1),
+                'matching_count': count,
+                'total_required': total,
+                'gap_count': total - count
+            })
+        return results
+
+    # -------------------------------
+    # Loading
+    # -------------------------------
+
+    def _reload_if_changed(self):
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self._mtime:
+            return
+
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            if self.path.lower().endswith(".csv"):
+                roles = _load_csv(self.path)
+            else:
+                roles = _load_json(self.path)
+            roles = {role.name: role for role in roles}
+
+            # Inverted index: normalized required skill -> roles requiring it
+            postings = {}
+            for role in roles.values():
+                for skill in role.required_set:
+                    postings.setdefault(skill, []).append(role.name)
+
+            # Swap in whole objects so readers never see a half-built catalog
+            self._roles, self._postings = roles, {s: tuple(r) for s, r in postings.items()}
+            self._mtime = mtime
+
+
+def _split_skills(cell):
+    return [s.strip() for s in (cell or "").split(",") if s.strip()]
+
+
+def _split_weights(cell):
+    """'Java:3, Communication:0.5' -> {'Java': 3.0, 'Communication': 0.5}"""
+    weights = {}
+    for part in _split_skills(cell):
+        skill, _, weight = part.rpartition(":")
+        if skill.strip():
+            weights[skill.strip()] = float(weight)
+    return weights
+
+
+def _load_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if not row.get("role"):
+                continue
+            yield JobRole(
+                row["role"].strip(),
+                _split_skills(row.get("required_skills")),
+                _split_skills(row.get("nice_to_have")),
+                (row.get("experience") or "0-2 years").strip(),
+                skill_weights=_split_weights(row.get("skill_weights"))
+            )
+
+
+def _load_json(path):
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    for entry in document["roles"]:
+        yield JobRole(
+            entry["role"],
+            entry.get("required_skills", []),
+            entry.get("nice_to_have", []),
+            entry.get("experience", "0-2 years"),
+            skill_weights=entry.get("skill_weights"),
+            skill_frequency=entry.get("skill_frequency")
+        )
+
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_job_catalog(path=None):
+    """
+    Shared catalog instance for a file
+
+    Args:
+        path: CSV or JSON catalog (default: $JOB_CATALOG_PATH or bundled job_roles.json)
+
+    Returns:
+        JobCatalog, created on first use and reused afterwards
+    """
+    path = os.path.abspath(path or os.environ.get("JOB_CATALOG_PATH") or DEFAULT_CATALOG_PATH)
+    with _catalogs_lock:
+        if path not in _catalogs:
+            _catalogs[path] = JobCatalog(path)
+        return _catalogs[path]
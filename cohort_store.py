@@ -0,0 +1,403 @@
+# 🏫 CAREER NAVIGATOR - Cohort Profile Store
+# Local SQLite store of every student's skills, gaps and match scores, with indexed set queries
+#
+# Usage:
+#   store = CohortStore("cohort.sqlite")
+#   store.upsert_students([{"student": "ananya", "batch": "2026", "role": "Backend Developer",
+#                           "skills": [...], "gaps": gaps, "score": score}, ...])
+#   store.lacking(["Docker", "SQL"], batch="2026")
+
+import sqlite3
+import threading
+import time
+
+from records import GitHubProfile, ResumeProfile, dumps, loads
+from skills import REGISTRY
+
+# Students per executemany round trip during bulk upserts
+UPSERT_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    student_key TEXT NOT NULL UNIQUE,
+    name TEXT,
+    batch TEXT,
+    role TEXT,
+    match_percentage REAL,
+    gap_count INTEGER,
+    github BLOB,
+    resume BLOB,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_students_batch_role ON students (batch, role);
+CREATE INDEX IF NOT EXISTS idx_students_role ON students (role);
+
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+-- kind: 'has' (extracted skill), 'required' / 'nice' (gap against the target role)
+CREATE TABLE IF NOT EXISTS student_skills (
+    student_id INTEGER NOT NULL REFERENCES students (id) ON DELETE CASCADE,
+    skill_id INTEGER NOT NULL REFERENCES skills (id),
+    kind TEXT NOT NULL,
+    PRIMARY KEY (student_id, kind, skill_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_student_skills_lookup ON student_skills (skill_id, kind, student_id);
+"""
+
+
+class CohortStore:
+    """
+    Persisted analysis results for a whole cohort
+
+    Skills are stored by canonical name (through the shared SkillRegistry),
+    so "Node" and "Node.js" are the same skill in every query. Each student
+    has one row in `students` plus one row per (kind, skill) in the
+    normalised `student_skills` table, indexed by skill for set queries.
+    """
+
+    def __init__(self, path="cohort.sqlite"):
+        """
+        Args:
+            path: SQLite file (":memory:" for a throwaway store)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+        # canonical skill name -> row id
+        self._skill_ids = dict(self._db.execute("SELECT name, id FROM skills"))
+
+    # -------------------------------
+    # Writing
+    # -------------------------------
+
+    def upsert_students(self, students):
+        """
+        Insert or replace many students in one transaction
+
+        Args:
+            students: Iterable of dicts with keys
+                student: Unique key (e.g. GitHub username or roll number)
+                name / batch / role: Optional descriptive fields
+                skills: List of skill names the student has
+                gaps: Dict from analyze_skill_gaps() (or records.GapResult)
+                score: Dict from calculate_match_score()
+                github / resume: Optional profile dicts or records, kept as compact blobs
+
+        Returns:
+            Number of students written
+        """
+        written = 0
+        chunk = []
+        with self._lock:
+            try:
+                for student in students:
+                    chunk.append(student)
+                    if len(chunk) >= UPSERT_CHUNK:
+                        written += self._write_chunk(chunk)
+                        chunk = []
+                if chunk:
+                    written += self._write_chunk(chunk)
+                self._db.commit()
+            except BaseException:
+                self._db.rollback()
+                # Skill rows inserted by this transaction are gone again: forget their cached ids
+                self._skill_ids = dict(self._db.execute("SELECT name, id FROM skills"))
+                raise
+        return written
+
+    def upsert_student(self, student):
+        """Insert or replace one student (see upsert_students)"""
+        return self.upsert_students([student])
+
+    def delete_students(self, keys):
+        """Remove students (and their skill rows) by key"""
+        keys = list(keys)
+        with self._lock:
+            self._db.executemany("DELETE FROM students WHERE student_key = ?", [(key,) for key in keys])
+            self._db.commit()
+
+    def _write_chunk(self, chunk):
+        # One record per student key, the last one winning, as separate upserts would
+        chunk = list({student["student"]: student for student in chunk}.values())
+        now = time.time()
+        rows = []
+        for student in chunk:
+            score = student.get("score") or {}
+            gaps = student.get("gaps")
+            batch = student.get("batch")
+            rows.append((
+                student["student"], student.get("name"), str(batch) if batch is not None else None,
+                student.get("role"), score.get("match_percentage"),
+                gaps.get("gap_count") if gaps is not None else score.get("gap_count"),
+                _blob(student.get("github"), GitHubProfile), _blob(student.get("resume"), ResumeProfile),
+                now
+            ))
+
+        self._db.executemany(
+            """
+            INSERT INTO students (student_key, name, batch, role, match_percentage, gap_count, github, resume, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (student_key) DO UPDATE SET
+                name = excluded.name, batch = excluded.batch, role = excluded.role,
+                match_percentage = excluded.match_percentage, gap_count = excluded.gap_count,
+                github = excluded.github, resume = excluded.resume, updated_at = excluded.updated_at
+            """,
+            rows
+        )
+
+        keys = [row[0] for row in rows]
+        student_ids = dict(self._db.execute(
+            f"SELECT student_key, id FROM students WHERE student_key IN ({','.join('?' * len(keys))})", keys
+        ))
+        ids = list(student_ids.values())
+        self._db.execute(
+            f"DELETE FROM student_skills WHERE student_id IN ({','.join('?' * len(ids))})", ids
+        )
+
+        links = []
+        for student in chunk:
+            student_id = student_ids[student["student"]]
+            gaps = student.get("gaps") or {}
+            for kind, skills in (
+                ("has", student.get("skills")),
+                ("required", gaps.get("missing_required")),
+                ("nice", gaps.get("missing_nice_to_have"))
+            ):
+                for skill_id in self._skill_row_ids(skills or ()):
+                    links.append((student_id, skill_id, kind))
+
+        self._db.executemany(
+            "INSERT OR IGNORE INTO student_skills (student_id, skill_id, kind) VALUES (?, ?, ?)", links
+        )
+        return len(rows)
+
+    def _skill_row_ids(self, skills):
+        """Row IDs for skill names, creating rows for new canonical names (lock held)"""
+        result = set()
+        for skill in skills:
+            if not skill or not skill.strip():
+                continue
+            name = REGISTRY.canonical(skill)
+            row_id = self._skill_ids.get(name)
+            if row_id is None:
+                self._db.execute("INSERT OR IGNORE INTO skills (name) VALUES (?)", (name,))
+                row_id = self._db.execute("SELECT id FROM skills WHERE name = ?", (name,)).fetchone()[0]
+                self._skill_ids[name] = row_id
+            result.add(row_id)
+        return result
+
+    # -------------------------------
+    # Set queries
+    # -------------------------------
+
+    def lacking(self, skills, batch=None, role=None):
+        """
+        Students who have none of the given skills
+
+        e.g. lacking(["Docker", "SQL"], batch="2026") answers
+        "which students in batch 2026 lack Docker and SQL?"
+
+        Returns:
+            Sorted list of student keys
+        """
+        skill_ids = self._lookup_skills(skills)
+        where, params = self._student_filter(batch, role)
+        if skill_ids:
+            placeholders = ",".join("?" * len(skill_ids))
+            where.append(
+                "NOT EXISTS (SELECT 1 FROM student_skills ss WHERE ss.student_id = s.id "
+                f"AND ss.kind = 'has' AND ss.skill_id IN ({placeholders}))"
+            )
+            params += skill_ids
+        return self._student_keys(where, params)
+
+    def having(self, skills, batch=None, role=None, match="all"):
+        """
+        Students who have all (match="all") or any (match="any") of the given skills
+
+        Returns:
+            Sorted list of student keys
+        """
+        return self._by_skill_kind("has", skills, batch, role, match)
+
+    def missing_required(self, skills, batch=None, role=None, match="all"):
+        """Students whose gap analysis lists all / any of these skills as missing required skills"""
+        return self._by_skill_kind("required", skills, batch, role, match)
+
+    def top_gaps(self, batch=None, role=None, kind="required", limit=10):
+        """
+        Most common gaps in a (filtered) cohort
+
+        Returns:
+            List of (canonical skill name, number of students) pairs
+        """
+        where, params = self._student_filter(batch, role)
+        where.append("ss.kind = ?")
+        params.append(kind)
+        params.append(limit)
+        with self._lock:
+            return self._db.execute(
+                f"""
+                SELECT sk.name, COUNT(*) AS students
+                FROM student_skills ss
+                JOIN students s ON s.id = ss.student_id
+                JOIN skills sk ON sk.id = ss.skill_id
+                WHERE {" AND ".join(where)}
+                GROUP BY ss.skill_id
+                ORDER BY students DESC, sk.name
+                LIMIT ?
+                """,
+                params
+            ).fetchall()
+
+    def get_student(self, key):
+        """
+        Stored results for one student
+
+        Returns:
+            Dict with the student's fields, skills, gaps and score, or None
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, student_key, name, batch, role, match_percentage, gap_count, github, resume, updated_at "
+                "FROM students WHERE student_key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            links = self._db.execute(
+                "SELECT ss.kind, sk.name FROM student_skills ss JOIN skills sk ON sk.id = ss.skill_id "
+                "WHERE ss.student_id = ? ORDER BY sk.name",
+                (row[0],)
+            ).fetchall()
+
+        by_kind = {"has": [], "required": [], "nice": []}
+        for kind, name in links:
+            by_kind[kind].append(name)
+
+        return {
+            "student": row[1],
+            "name": row[2],
+            "batch": row[3],
+            "role": row[4],
+            "skills": by_kind["has"],
+            "gaps": {
+                "missing_required": by_kind["required"],
+                "missing_nice_to_have": by_kind["nice"],
+                "gap_count": row[6]
+            },
+            "match_percentage": row[5],
+            "github": loads(row[7])[0] if row[7] is not None else None,
+            "resume": loads(row[8])[0] if row[8] is not None else None,
+            "updated_at": row[9]
+        }
+
+    def stats(self):
+        """Row counts of the store"""
+        with self._lock:
+            students, skills, links = self._db.execute(
+                "SELECT (SELECT COUNT(*) FROM students), (SELECT COUNT(*) FROM skills), "
+                "(SELECT COUNT(*) FROM student_skills)"
+            ).fetchone()
+        return {"students": students, "skills": skills, "student_skills": links}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # -------------------------------
+    # Internal helpers
+    # -------------------------------
+
+    def _lookup_skills(self, skills):
+        """Row IDs of known skills (unknown skills match nobody)"""
+        if isinstance(skills, str):
+            skills = [skills]
+        with self._lock:
+            return sorted({
+                self._skill_ids[name]
+                for name in (REGISTRY.canonical(skill) for skill in skills if skill and skill.strip())
+                if name in self._skill_ids
+            })
+
+    def _by_skill_kind(self, kind, skills, batch, role, match):
+        if isinstance(skills, str):
+            skills = [skills]
+        wanted = {REGISTRY.canonical(skill) for skill in skills if skill and skill.strip()}
+        skill_ids = self._lookup_skills(skills)
+        if not wanted or (match == "all" and len(skill_ids) < len(wanted)) or not skill_ids:
+            return []
+
+        where, params = self._student_filter(batch, role)
+        placeholders = ",".join("?" * len(skill_ids))
+        having = "HAVING COUNT(*) = ?" if match == "all" else ""
+        query_params = [kind] + skill_ids + params + ([len(skill_ids)] if match == "all" else [])
+        with self._lock:
+            rows = self._db.execute(
+                f"""
+                SELECT s.student_key
+                FROM student_skills ss
+                JOIN students s ON s.id = ss.student_id
+                WHERE ss.kind = ? AND ss.skill_id IN ({placeholders}) AND {" AND ".join(where)}
+                GROUP BY ss.student_id
+                {having}
+                """,
+                query_params
+            ).fetchall()
+        return sorted(key for (key,) in rows)
+
+    @staticmethod
+    def _student_filter(batch, role):
+        where, params = ["1 = 1"], []
+        if batch is not None:
+            where.append("s.batch = ?")
+            params.append(str(batch))
+        if role is not None:
+            where.append("s.role = ?")
+            params.append(role)
+        return where, params
+
+    def _student_keys(self, where, params):
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT s.student_key FROM students s WHERE {' AND '.join(where)}", params
+            ).fetchall()
+        return sorted(key for (key,) in rows)
+
+
+def _blob(profile, record_type):
+    """Compact binary copy of a profile dict or record (records.dumps), or None"""
+    if profile is None:
+        return None
+    if not isinstance(profile, record_type):
+        profile = record_type.from_dict(profile)
+    return dumps(profile)
+
+
+# -------------------------------
+# 🧪 TEST HARNESS
+# -------------------------------
+
+if __name__ == "__main__":
+
+    print("🧪 COHORT STORE TEST\n")
+    store = CohortStore(":memory:")
+
+    # The same student twice in one batch: the last record wins, nothing is merged
+    store.upsert_students([
+        {"student": "dup", "skills": ["Java"]},
+        {"student": "dup", "skills": ["Rust"]}
+    ])
+    assert store.get_student("dup")["skills"] == ["rust"], store.get_student("dup")
+    assert store.having(["Java"]) == []
+    print("✅ Duplicate keys in one batch: last record wins")
@@ -10,49 +10,187 @@ pip install PyPDF2 requests
 OR if using pip3:
 
 pip3 install PyPDF2 requests
+
+Optional (much faster PDF text extraction, used automatically when present):
+
+pip install PyMuPDF
 """
 
-import pandas as pd
+import copy
+import hashlib
+import importlib
+import io
+import json
+import os
 import re
+import threading
+from collections import OrderedDict
+
+import metrics
+from catalog import get_job_catalog
+from github_scheduler import BATCH, INTERACTIVE, GitHubScheduler, RateLimitDeferred
+from skills import DEFAULT_MATCHER
+
+
+# -------------------------------
+# 💤 Optional dependencies (imported lazily on first use)
+# -------------------------------
+
+_optional_modules = {}
+
+_MISSING_WARNINGS = {
+    "requests": "⚠️  requests not installed. GitHub API will use mock data.\n"
+                "   Install with: pip install requests",
+    "pdf": "⚠️  No PDF library installed. Resume parsing will use mock data.\n"
+           "   Install with: pip install PyMuPDF  (or: pip install PyPDF2)"
+}
+
+
+def _optional_import(*names):
+    """
+    Import the first installable module of names, once, on first use
+    
+    Keeps `import data` free of heavy imports and stdout side effects;
+    the cost is paid by the first call that actually needs the library.
+    
+    Returns:
+        The module, or None when none of the names is installed
+    """
+    key = names[0]
+    if key not in _optional_modules:
+        module = None
+        for name in names:
+            try:
+                module = importlib.import_module(name)
+                break
+            except ImportError:
+                continue
+        _optional_modules[key] = module
+    return _optional_modules[key]
+
+
+def _warn_missing(feature):
+    """Print the install hint for a missing dependency once per process"""
+    message = _MISSING_WARNINGS.pop(feature, None)
+    if message:
+        print(message)
+
+
+def _requests():
+    return _optional_import("requests")
+
 
-# Try importing optional dependencies
-try:
-    import PyPDF2
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-    print("⚠️  PyPDF2 not installed. Resume parsing will use mock data.")
-    print("   Install with: pip install PyPDF2")
+def _pymupdf():
+    # Newer PyMuPDF releases expose `pymupdf`; older ones only `fitz`
+    return _optional_import("pymupdf", "fitz")
 
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
-    print("⚠️  requests not installed. GitHub API will use mock data.")
-    print("   Install with: pip install requests")
+
+def _pypdf2():
+    return _optional_import("PyPDF2")
+
+
+# -------------------------------
+# 🗄️ GitHub Response Cache (optional)
+# -------------------------------
+
+_github_cache = None
+
+
+def configure_github_cache(path=".github_cache.sqlite", ttl=3600, max_bytes=50 * 1024 * 1024):
+    """
+    Enable the persistent GitHub response cache for all GitHub calls
+    
+    Args:
+        path: SQLite file holding cached responses
+        ttl: Seconds a response is served without revalidation
+        max_bytes: Size cap for cached bodies (least recently used evicted first)
+        
+    Returns:
+        The active GitHubResponseCache
+    """
+    global _github_cache
+    from http_cache import GitHubResponseCache
+    
+    if _github_cache is not None:
+        _github_cache.close()
+    _github_cache = GitHubResponseCache(path=path, ttl=ttl, max_bytes=max_bytes)
+    return _github_cache
+
+
+def get_github_cache_stats():
+    """Cache hit/miss counters, or None when the cache is disabled"""
+    return _github_cache.stats() if _github_cache is not None else None
+
+
+# -------------------------------
+# 🚦 GitHub Rate-Limit Scheduler (shared by every GitHub call)
+# -------------------------------
+
+_github_scheduler = GitHubScheduler()
+
+
+def configure_github_scheduler(**options):
+    """
+    Replace the shared GitHub scheduler
+    
+    Args:
+        **options: GitHubScheduler arguments (rate, burst, reserve, max_wait, ...)
+        
+    Returns:
+        The active GitHubScheduler
+    """
+    global _github_scheduler
+    _github_scheduler = GitHubScheduler(**options)
+    return _github_scheduler
+
+
+def get_github_scheduler():
+    return _github_scheduler
+
+
+def is_deferred(github_data):
+    """True for get_github_skills() results postponed by the rate limit"""
+    return bool(github_data) and github_data.get("status") == "deferred"
+
+
+def _github_get(http, url, timeout=10, priority=INTERACTIVE):
+    """GET a GitHub API URL, through the response cache when enabled and the rate-limit scheduler"""
+    http = _github_scheduler.wrap(http, priority=priority)
+    if _github_cache is not None:
+        response = _github_cache.get(http, url, timeout=timeout)
+        metrics.incr("github_cache_hits" if getattr(response, "from_cache", False) else "github_cache_misses")
+        return response
+    return http.get(url, timeout=timeout)
 
 
 # -------------------------------
 # 📦 GitHub Profile Extractor (REAL API)
 # -------------------------------
 
-def get_github_skills(github_user):
+# Point at a local stand-in for offline benchmarks and load tests
+GITHUB_API_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+
+def get_github_skills(github_user, session=None, priority=INTERACTIVE):
     """
     Extract skills from GitHub profile using GitHub API
     
     Args:
         github_user: GitHub username
+        session: Optional requests.Session to reuse pooled keep-alive connections
+        priority: Scheduler priority (INTERACTIVE goes ahead of BATCH)
         
     Returns:
-        Dict with GitHub data including skills
+        Dict with GitHub data including skills, or a "deferred" result
+        (see is_deferred()) when the rate limit does not allow the fetch now
     """
     
     if not github_user or not github_user.strip():
         return None
     
     # If requests is not available, use mock data
-    if not REQUESTS_AVAILABLE:
+    requests = _requests()
+    if requests is None:
+        _warn_missing("requests")
         print(f"🔍 Using mock data for GitHub: {github_user}")
         return _get_mock_github_skills(github_user)
     
@@ -60,11 +198,14 @@ def get_github_skills(github_user):
         print(f"🔍 Fetching real GitHub data for: {github_user}")
         
         # GitHub API endpoints
-        user_url = f"https://api.github.com/users/{github_user}"
-        repos_url = f"https://api.github.com/users/{github_user}/repos?per_page=100"
+        user_url = f"{GITHUB_API_URL}/users/{github_user}"
+        
+        # Reuse the caller's pooled session when given one
+        http = session if session is not None else requests
         
         # Fetch user data
-        user_response = requests.get(user_url, timeout=10)
+        with metrics.span("github_user_fetch"):
+            user_response = _github_get(http, user_url, priority=priority)
         
         if user_response.status_code == 404:
             print(f"❌ GitHub user '{github_user}' not found")
@@ -76,16 +217,14 @@ def get_github_skills(github_user):
         
         user_data = user_response.json()
         
-        # Fetch repositories
-        repos_response = requests.get(repos_url, timeout=10)
-        repos = repos_response.json() if repos_response.status_code == 200 else []
-        
-        # Extract languages from repos
+        # Fetch every page of repositories, counting languages as pages arrive
         languages = {}
-        for repo in repos:
-            if repo.get('language'):
-                lang = repo['language']
-                languages[lang] = languages.get(lang, 0) + 1
+        with metrics.span("github_repos_fetch") as repos_span:
+            for repo in iter_github_repos(github_user, session=session, priority=priority):
+                repos_span.add("repos_fetched")
+                if repo.get('language'):
+                    lang = repo['language']
+                    languages[lang] = languages.get(lang, 0) + 1
         
         # Calculate percentages
         total = sum(languages.values())
@@ -138,6 +277,9 @@ def get_github_skills(github_user):
             "activity_level": "consistent" if repos_count >= 5 else "moderate"
         }
         
+    except RateLimitDeferred as e:
+        print(f"⏳ GitHub rate limit reached. Deferring {github_user} for {e.retry_after:.0f}s.")
+        return _deferred_github_skills(github_user, e.retry_after)
     except requests.exceptions.Timeout:
         print("⚠️  GitHub API timeout. Using mock data.")
         return _get_mock_github_skills(github_user)
@@ -149,8 +291,139 @@ def get_github_skills(github_user):
         return _get_mock_github_skills(github_user)
 
 
+def iter_github_repos(github_user, session=None, per_page=100, max_pages=None, priority=INTERACTIVE):
+    """
+    Stream a user's public repositories page by page
+    
+    Follows the ``Link: rel="next"`` header so users with hundreds of repos
+    are fully covered, while only one page is held in memory at a time.
+    
+    Args:
+        github_user: GitHub username
+        session: Optional requests.Session to reuse pooled connections
+        per_page: Repos requested per page (GitHub caps this at 100)
+        max_pages: Optional safety limit on the number of pages fetched
+        priority: Scheduler priority (INTERACTIVE goes ahead of BATCH)
+        
+    Yields:
+        Repository dicts as returned by the GitHub API
+    """
+    http = session if session is not None else _requests()
+    url = f"{GITHUB_API_URL}/users/{github_user}/repos?per_page={per_page}"
+    pages = 0
+    
+    while url and (max_pages is None or pages < max_pages):
+        response = _github_get(http, url, priority=priority)
+        if response.status_code != 200:
+            return
+        
+        page = response.json()
+        pages += 1
+        # Read the next link before handing out repos so the page can be freed
+        url = _next_page_url(response.headers)
+        
+        yield from page
+        del page
+
+
+def _next_page_url(headers):
+    """Extract the rel="next" target from a GitHub Link header"""
+    link_header = headers.get("Link") if headers else None
+    if not link_header:
+        return None
+    
+    for part in link_header.split(","):
+        match = re.match(r'\s*<([^>]+)>\s*;\s*rel="next"', part)
+        if match:
+            return match.group(1)
+    return None
+
+
+def create_github_session(pool_size=10):
+    """
+    Pooled keep-alive session for GitHub calls
+    
+    Args:
+        pool_size: Maximum number of connections kept open to the API host
+        
+    Returns:
+        requests.Session, or None when requests is not installed
+    """
+    requests = _requests()
+    if requests is None:
+        return None
+    
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_github_skills_many(usernames, concurrency=8, priority=BATCH, compact=False):
+    """
+    Fetch GitHub skills for a whole cohort in parallel
+    
+    Args:
+        usernames: Iterable of GitHub usernames
+        concurrency: Maximum number of profiles fetched at the same time
+        priority: Scheduler priority (BATCH yields to interactive lookups)
+        compact: Return records.GitHubProfile records instead of dicts
+        
+    Returns:
+        List of get_github_skills() results, in the same order as usernames;
+        users the rate limit did not allow are returned as "deferred"
+    """
+    usernames = list(usernames)
+    if not usernames:
+        return []
+    
+    if compact:
+        from records import GitHubProfile
+        profiles = get_github_skills_many(usernames, concurrency=concurrency, priority=priority)
+        return [GitHubProfile.from_dict(profile) if profile else None for profile in profiles]
+    
+    concurrency = max(1, min(concurrency, len(usernames)))
+    
+    # One keep-alive pool shared by all workers, sized to the concurrency limit
+    session = create_github_session(pool_size=concurrency)
+    
+    # Without requests every user falls back to mock data, no pool needed
+    if session is None:
+        return [get_github_skills(user, priority=priority) for user in usernames]
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(
+                lambda user: get_github_skills(user, session=session, priority=priority),
+                usernames
+            ))
+    finally:
+        session.close()
+
+
+def _deferred_github_skills(github_user, retry_after):
+    """Explicit placeholder for a profile the rate limit did not allow us to fetch"""
+    metrics.incr("github_deferred")
+    return {
+        "username": github_user,
+        "status": "deferred",
+        "retry_after": round(retry_after),
+        "repos_count": 0,
+        "experience_level": None,
+        "top_languages": {},
+        "skills": [],
+        "activity_level": None
+    }
+
+
 def _get_mock_github_skills(github_user):
     """Fallback mock data when API is unavailable"""
+    metrics.incr("github_mock_fallbacks")
     return {
         "username": github_user,
         "repos_count": 8,
@@ -179,12 +452,239 @@ def _get_mock_github_skills(github_user):
 # 📄 Resume Parser (REAL PDF PARSING)
 # -------------------------------
 
-def extract_resume_skills(resume_file):
+# -------------------------------
+# 📚 PDF Backends (PyMuPDF fast path, PyPDF2 fallback)
+# -------------------------------
+
+def _pymupdf_pages(resume_file):
+    """Yield raw page text using PyMuPDF"""
+    fitz = _pymupdf()
+    if isinstance(resume_file, bytes):
+        doc = fitz.open(stream=resume_file, filetype="pdf")
+    elif isinstance(resume_file, str) or hasattr(resume_file, "__fspath__"):
+        doc = fitz.open(resume_file)
+    else:
+        # File-like upload (e.g. Streamlit UploadedFile)
+        if hasattr(resume_file, "seek"):
+            resume_file.seek(0)
+        doc = fitz.open(stream=resume_file.read(), filetype="pdf")
+    
+    with doc:
+        for page in doc:
+            yield page.get_text()
+
+
+def _pypdf2_pages(resume_file):
+    """Yield raw page text using PyPDF2"""
+    PyPDF2 = _pypdf2()
+    if isinstance(resume_file, bytes):
+        resume_file = io.BytesIO(resume_file)
+    pdf_reader = PyPDF2.PdfReader(resume_file)
+    for page in pdf_reader.pages:
+        yield page.extract_text() or ""
+
+
+# Fastest first; get_pdf_backend() picks the first one installed
+PDF_BACKENDS = {
+    "pymupdf": _pymupdf_pages,
+    "pypdf2": _pypdf2_pages
+}
+
+def available_pdf_backends():
+    """Names of the PDF backends installed in this deployment, fastest first"""
+    installed = {"pymupdf": _pymupdf, "pypdf2": _pypdf2}
+    return [name for name in PDF_BACKENDS if installed[name]() is not None]
+
+
+def get_pdf_backend(name=None):
+    """
+    Resolve the PDF backend to use
+    
+    Args:
+        name: 'pymupdf', 'pypdf2' or None for the fastest installed one
+              (the PDF_BACKEND environment variable overrides the default)
+        
+    Returns:
+        Backend name
+    """
+    name = name or os.environ.get("PDF_BACKEND")
+    available = available_pdf_backends()
+    
+    if name:
+        if name not in PDF_BACKENDS:
+            raise ValueError(f"Unknown PDF backend '{name}'. Choose from: {', '.join(PDF_BACKENDS)}")
+        if name not in available:
+            raise ValueError(f"PDF backend '{name}' is not installed")
+        return name
+    
+    if not available:
+        raise ValueError("No PDF backend installed")
+    return available[0]
+
+
+# Guards against pathological uploads
+RESUME_MAX_PAGES = 50
+RESUME_MAX_BYTES = 1_000_000
+
+# Short lines that open a resume section, e.g. "Technical Skills" or "PROJECTS:"
+_SECTION_HEADING = re.compile(
+    r'^(?:(?P<skills>(?:technical\s+|key\s+|core\s+)?skills(?:\s*(?:&|and)\s*\w+)?)'
+    r'|education|experience|work experience|projects|academic projects|internships?'
+    r'|certifications?|achievements|publications|interests|hobbies|activities)\s*:?$'
+)
+
+
+def iter_resume_pages(resume_file, max_pages=RESUME_MAX_PAGES, max_bytes=RESUME_MAX_BYTES,
+                      backend=None):
+    """
+    Stream normalised (lowercased) resume text one page at a time
+    
+    Args:
+        resume_file: Streamlit uploaded file object or path
+        max_pages: Stop after this many pages
+        max_bytes: Stop once this much extracted text has been produced
+        backend: PDF backend name (default: fastest installed)
+        
+    Yields:
+        Lowercased text of each page
+    """
+    pages = PDF_BACKENDS[get_pdf_backend(backend)](resume_file)
+    consumed = 0
+    
+    for number in range(max_pages + 1):
+        with metrics.span("pdf_page_extraction") as page_span:
+            page_text = next(pages, None)
+            if page_text is None:
+                return
+            if number >= max_pages:
+                print(f"⚠️  Resume longer than {max_pages} pages. Ignoring the rest.")
+                return
+            
+            text = page_text.lower()
+            size = len(text.encode("utf-8"))
+            page_span.add("bytes_parsed", size)
+            page_span.add("pages_parsed")
+        
+        consumed += size
+        if consumed > max_bytes:
+            print(f"⚠️  Resume text exceeds {max_bytes} bytes. Ignoring the rest.")
+            return
+        
+        yield text
+
+
+# -------------------------------
+# 🧠 Resume Parse Cache (content-hash memoization)
+# -------------------------------
+
+RESUME_CACHE_SIZE = 128
+
+_resume_cache = OrderedDict()
+_resume_cache_lock = threading.Lock()
+_resume_cache_dir = None
+_resume_cache_stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+
+def configure_resume_cache(directory=None, max_entries=RESUME_CACHE_SIZE):
+    """
+    Configure the parsed-resume cache
+    
+    Args:
+        directory: Optional folder for the on-disk tier that survives restarts
+        max_entries: Size of the in-memory LRU tier
+    """
+    global _resume_cache_dir, RESUME_CACHE_SIZE
+    
+    with _resume_cache_lock:
+        RESUME_CACHE_SIZE = max_entries
+        while len(_resume_cache) > RESUME_CACHE_SIZE:
+            _resume_cache.popitem(last=False)
+    
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    _resume_cache_dir = directory
+
+
+def get_resume_cache_stats():
+    """Hit/miss counters of the parsed-resume cache"""
+    with _resume_cache_lock:
+        return dict(_resume_cache_stats, entries=len(_resume_cache))
+
+
+def _read_resume_bytes(resume_file):
+    """Raw bytes of an upload (Streamlit UploadedFile, file object, path or bytes)"""
+    if isinstance(resume_file, bytes):
+        return resume_file
+    if isinstance(resume_file, str) or hasattr(resume_file, "__fspath__"):
+        with open(resume_file, "rb") as f:
+            return f.read()
+    if hasattr(resume_file, "getvalue"):
+        return resume_file.getvalue()
+    if hasattr(resume_file, "seek"):
+        resume_file.seek(0)
+    return resume_file.read()
+
+
+def _resume_cache_get(key):
+    with _resume_cache_lock:
+        if key in _resume_cache:
+            _resume_cache.move_to_end(key)
+            _resume_cache_stats["memory_hits"] += 1
+            return copy.deepcopy(_resume_cache[key])
+    
+    if _resume_cache_dir:
+        path = os.path.join(_resume_cache_dir, f"{key}.json")
+        try:
+            with open(path, encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            result = None
+        if result is not None:
+            _resume_cache_put(key, result, write_disk=False)
+            with _resume_cache_lock:
+                _resume_cache_stats["disk_hits"] += 1
+            return copy.deepcopy(result)
+    
+    with _resume_cache_lock:
+        _resume_cache_stats["misses"] += 1
+    return None
+
+
+def _resume_cache_put(key, result, write_disk=True):
+    with _resume_cache_lock:
+        _resume_cache[key] = copy.deepcopy(result)
+        _resume_cache.move_to_end(key)
+        while len(_resume_cache) > RESUME_CACHE_SIZE:
+            _resume_cache.popitem(last=False)
+    
+    if write_disk and _resume_cache_dir:
+        path = os.path.join(_resume_cache_dir, f"{key}.json")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  Could not write resume cache: {e}")
+
+
+def extract_resume_skills(resume_file, matcher=None, max_pages=RESUME_MAX_PAGES,
+                          max_bytes=RESUME_MAX_BYTES, early_stop=False, backend=None):
     """
     Extract skills from uploaded resume PDF
     
+    Pages are streamed into the skill matcher one at a time, so memory
+    stays flat no matter how long the PDF is. Results are memoized by the
+    SHA-256 of the uploaded bytes and the skill vocabulary fingerprint, so
+    re-analysing an already seen resume skips parsing entirely.
+    
     Args:
         resume_file: Streamlit uploaded file object
+        matcher: Optional SkillMatcher for a custom vocabulary (default: bundled)
+        max_pages: Page limit for the upload
+        max_bytes: Extracted-text limit for the upload
+        early_stop: Stop reading once the header and skills section are covered
+        backend: PDF backend name (default: PyMuPDF when installed, else PyPDF2)
         
     Returns:
         Dict with resume data including skills
@@ -193,109 +693,120 @@ def extract_resume_skills(resume_file):
     if resume_file is None:
         return None
     
-    # If PyPDF2 is not available, use mock data
-    if not PDF_AVAILABLE:
-        print("📄 Using mock resume data (PyPDF2 not installed)")
+    # If no PDF library is available, use mock data
+    if not available_pdf_backends():
+        _warn_missing("pdf")
+        print("📄 Using mock resume data (no PDF library installed)")
         return _get_mock_resume_data()
     
+    matcher = matcher or DEFAULT_MATCHER
+    
     try:
-        print("📄 Parsing resume PDF...")
-        
-        # Read PDF content
-        pdf_reader = PyPDF2.PdfReader(resume_file)
-        
-        # Extract text from all pages
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        
-        # Normalize text
-        text = text.lower()
-        
-        # Define skill keywords to search for
-        programming_languages = [
-            'python', 'java', 'javascript', 'c++', 'c', 'c#', 'ruby', 'go', 
-            'rust', 'kotlin', 'swift', 'typescript', 'php', 'r', 'matlab'
-        ]
+        content = _read_resume_bytes(resume_file)
         
-        web_technologies = [
-            'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express',
-            'django', 'flask', 'spring boot', 'bootstrap', 'tailwind'
-        ]
-        
-        databases = [
-            'sql', 'mysql', 'postgresql', 'mongodb', 'oracle', 'redis',
-            'sqlite', 'cassandra', 'dynamodb'
-        ]
+        # Anything that changes the parse result is part of the key
+        options = f"{matcher.fingerprint}|{max_pages}|{max_bytes}|{early_stop}|{get_pdf_backend(backend)}"
+        key = hashlib.sha256(content).hexdigest() + "-" + hashlib.sha256(options.encode()).hexdigest()[:16]
         
-        tools_frameworks = [
-            'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp',
-            'jenkins', 'ci/cd', 'linux', 'vs code', 'junit', 'maven', 'gradle'
-        ]
+        cached = _resume_cache_get(key)
+        if cached is not None:
+            metrics.incr("resume_cache_hits")
+            print("📄 Using cached resume analysis")
+            return cached
         
-        ai_ml = [
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch',
-            'scikit-learn', 'keras', 'nlp', 'computer vision', 'pandas',
-            'numpy', 'matplotlib'
-        ]
+        print("📄 Parsing resume PDF...")
+        result = _parse_resume(content, matcher, max_pages, max_bytes, early_stop, backend)
+        _resume_cache_put(key, result)
+        return result
         
-        core_cs = [
-            'data structures', 'algorithms', 'dbms', 'operating systems',
-            'computer networks', 'oops', 'system design'
-        ]
+    except Exception as e:
+        print(f"⚠️  Error parsing PDF: {e}. Using mock data.")
+        return _get_mock_resume_data()
+
+
+def _parse_resume(content, matcher, max_pages, max_bytes, early_stop, backend):
+    """Stream a resume PDF's pages through the skill matcher and build the result dict"""
+    found = set()
+    name = None
+    cgpa = None
+    has_bachelor = has_ai = has_ml = has_data_science = False
+    skills_section = None  # None -> not seen, "open" -> reading it, "done"
+    tail = ""
+    
+    pages = iter_resume_pages(content, max_pages=max_pages, max_bytes=max_bytes, backend=backend)
+    for text in pages:
+        # Carry the end of the previous page so skills split across pages still match
+        with metrics.span("skill_matching"):
+            found |= matcher.find(tail + "\n" + text)
+        tail = _page_tail(text, matcher.max_keyword_length)
         
-        # Extract skills found in resume
-        found_languages = [lang for lang in programming_languages if lang in text]
-        found_web = [tech for tech in web_technologies if tech in text]
-        found_db = [db for db in databases if db in text]
-        found_tools = [tool for tool in tools_frameworks if tool in text]
-        found_ai = [ai for ai in ai_ml if ai in text]
-        found_cs = [cs for cs in core_cs if cs in text]
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
         
         # Try to extract name (simple heuristic - first line might be name)
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        name = lines[0].title() if lines else "CS Student"
+        if name is None and lines:
+            name = lines[0].title()
         
         # Try to extract CGPA/GPA
-        cgpa_match = re.search(r'(?:cgpa|gpa)[:\s]+(\d+\.?\d*)', text)
-        cgpa = float(cgpa_match.group(1)) if cgpa_match else 8.0
-        
-        # Try to extract degree
-        degree = "B.Tech Computer Science"
-        if 'b.tech' in text or 'bachelor' in text:
-            if 'ai' in text and 'ml' in text:
-                degree = "B.Tech Computer Science (AI & ML)"
-            elif 'data science' in text:
-                degree = "B.Tech Computer Science (Data Science)"
-        
-        return {
-            "name": name,
-            "education": {
-                "degree": degree,
-                "institution": "Engineering College",
-                "year": "Current Student",
-                "cgpa": cgpa
-            },
-            "technical_skills": {
-                "languages": [lang.title() for lang in found_languages],
-                "web": [tech.title() for tech in found_web],
-                "databases": [db.upper() if db == 'sql' else db.title() for db in found_db],
-                "ai_ml": [ai.title() for ai in found_ai],
-                "core_cs": [cs.title() for cs in found_cs],
-                "tools": [tool.title() for tool in found_tools]
-            },
-            "projects": [],  # Would need more sophisticated parsing
-            "interests": ["Technology", "Problem Solving"],
-            "strengths": ["Quick Learner", "Analytical Thinking"]
-        }
-        
-    except Exception as e:
-        print(f"⚠️  Error parsing PDF: {e}. Using mock data.")
-        return _get_mock_resume_data()
+        if cgpa is None:
+            cgpa_match = re.search(r'(?:cgpa|gpa)[:\s]+(\d+\.?\d*)', text)
+            if cgpa_match:
+                cgpa = float(cgpa_match.group(1))
+        
+        has_bachelor = has_bachelor or 'b.tech' in text or 'bachelor' in text
+        has_ai = has_ai or 'ai' in text
+        has_ml = has_ml or 'ml' in text
+        has_data_science = has_data_science or 'data science' in text
+        
+        # Track where the skills section starts and ends
+        for line in lines:
+            heading = _SECTION_HEADING.match(line)
+            if not heading:
+                continue
+            if heading.group('skills'):
+                skills_section = "open"
+            elif skills_section == "open":
+                skills_section = "done"
+        
+        if early_stop and name is not None and skills_section == "done":
+            break
+    
+    found_skills = matcher.categorize(found)
+    
+    # Try to extract degree
+    degree = "B.Tech Computer Science"
+    if has_bachelor:
+        if has_ai and has_ml:
+            degree = "B.Tech Computer Science (AI & ML)"
+        elif has_data_science:
+            degree = "B.Tech Computer Science (Data Science)"
+    
+    return {
+        "name": name or "CS Student",
+        "education": {
+            "degree": degree,
+            "institution": "Engineering College",
+            "year": "Current Student",
+            "cgpa": cgpa if cgpa is not None else 8.0
+        },
+        "technical_skills": found_skills,
+        "projects": [],  # Would need more sophisticated parsing
+        "interests": ["Technology", "Problem Solving"],
+        "strengths": ["Quick Learner", "Analytical Thinking"]
+    }
+
+
+def _page_tail(text, length):
+    """Last few characters of a page, cut at a whitespace so no word is split"""
+    if length <= 0:
+        return ""
+    tail = text[-length:]
+    cut = re.search(r'\s', tail)
+    return tail[cut.start():] if cut else ""
 
 
 def _get_mock_resume_data():
     """Fallback mock data when PDF parsing is unavailable"""
+    metrics.incr("resume_mock_fallbacks")
     return {
         "name": "CS Student",
         "education": {
@@ -340,40 +851,36 @@ def _get_mock_resume_data():
 # 📊 Job Requirements Loader
 # -------------------------------
 
-def load_job_requirements(role=None):
-    """Load job requirements - returns dict or filters by role"""
+def load_job_requirements(role=None, path=None):
+    """
+    Load job requirements - returns dict or filters by role
     
-    job_data = {
-        "Software Engineer": {
-            "required_skills": ["Java", "Python", "React", "Docker", "SQL", "Git", "REST APIs", "Data Structures", "Algorithms", "Communication"],
-            "nice_to_have": ["Spring Boot", "Microservices", "AWS", "CI/CD"],
-            "experience": "0-2 years"
-        },
-        "Data Scientist": {
-            "required_skills": ["Python", "Pandas", "NumPy", "Machine Learning", "SQL", "Statistics", "Data Visualization", "Jupyter", "TensorFlow", "Communication"],
-            "nice_to_have": ["Deep Learning", "NLP", "Big Data", "Spark"],
-            "experience": "0-2 years"
-        },
-        "Fullstack Developer": {
-            "required_skills": ["React", "Node.js", "JavaScript", "MongoDB", "Express.js", "Git", "REST APIs", "HTML", "CSS", "Docker"],
-            "nice_to_have": ["TypeScript", "GraphQL", "AWS", "Next.js"],
-            "experience": "0-2 years"
-        },
-        "Backend Developer": {
-            "required_skills": ["Java", "Spring Boot", "SQL", "Git", "Data Structures", "REST APIs", "Microservices"],
-            "nice_to_have": ["Docker", "Kubernetes", "Redis", "PostgreSQL"],
-            "experience": "0-2 years"
-        },
-        "AI Engineer": {
-            "required_skills": ["Python", "TensorFlow", "Statistics", "Machine Learning", "Deep Learning", "PyTorch", "NumPy"],
-            "nice_to_have": ["MLOps", "Computer Vision", "NLP", "Model Deployment"],
-            "experience": "0-2 years"
-        }
-    }
+    Roles come from a catalog file (bundled job_roles.json, or the CSV/JSON
+    in $JOB_CATALOG_PATH) that is parsed once and re-read only when the file
+    changes on disk.
+    
+    Args:
+        role: Optional role name; unknown roles fall back to Software Engineer,
+            or to the catalog's first role when it has no Software Engineer
+        path: Optional catalog file overriding the default
+        
+    Returns:
+        JobRole dict for one role, or a dict of role name -> JobRole
+        
+    Raises:
+        KeyError: when a role is requested from an empty catalog
+    """
+    catalog = get_job_catalog(path)
     
     if role:
-        return job_data.get(role, job_data["Software Engineer"])
-    return job_data
+        found = catalog.get(role) or catalog.get("Software Engineer")
+        if found is None:
+            roles = catalog.roles()
+            if not roles:
+                raise KeyError(f"Role '{role}' not found: job catalog {catalog.path} is empty")
+            found = catalog[roles[0]]
+        return found
+    return catalog.as_dict()
 
 
 # -------------------------------
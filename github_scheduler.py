@@ -0,0 +1,247 @@
+# 🚦 CAREER NAVIGATOR - Rate-Limit-Aware GitHub Scheduler
+# Token bucket paced by X-RateLimit-Remaining / X-RateLimit-Reset, priority queue, 403/429 backoff
+#
+# Interactive lookups (someone waiting in the app) are served ahead of batch cohort jobs.
+# When a request cannot be sent within its wait budget, RateLimitDeferred is raised so
+# callers can report "deferred" instead of making up a profile.
+
+import heapq
+import itertools
+import threading
+import time
+
+INTERACTIVE = 0
+BATCH = 10
+
+# Seconds a request may wait for the rate limit before it is deferred
+DEFAULT_MAX_WAIT = {INTERACTIVE: 5.0, BATCH: 300.0}
+
+
+class RateLimitDeferred(Exception):
+    """Raised when a request cannot be sent within its wait budget"""
+
+    def __init__(self, retry_after):
+        super().__init__(f"GitHub rate limit reached, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class GitHubScheduler:
+    """
+    Shared pacing for every GitHub API call of the process
+
+    Requests take a token from a bucket refilled at `rate` per second. Once
+    GitHub reports its remaining budget, the refill rate is lowered to spread
+    that budget over the time left until the reset, and requests stop
+    entirely when it is used up. 403/429 rate-limit replies block the bucket
+    for Retry-After seconds, until the reset, or with exponential backoff.
+    Waiting requests are granted lowest priority value first, FIFO within a
+    priority.
+    """
+
+    def __init__(self, rate=5000 / 3600, burst=10, reserve=0, max_wait=None,
+                 base_backoff=1.0, max_backoff=300.0):
+        """
+        Args:
+            rate: Upper bound on requests per second
+            burst: Bucket capacity (requests that can go out back to back)
+            reserve: Requests of the GitHub budget kept untouched
+            max_wait: Dict of priority -> seconds before deferring (DEFAULT_MAX_WAIT)
+            base_backoff: First backoff delay for rate-limit replies without hints
+            max_backoff: Upper bound on exponential backoff delays
+        """
+        self.rate = rate
+        self.burst = burst
+        self.reserve = reserve
+        self.max_wait = {**DEFAULT_MAX_WAIT, **(max_wait or {})}
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._cond = threading.Condition()
+        self._queue = []
+        self._sequence = itertools.count()
+        self._tokens = float(burst)
+        self._refill_rate = rate
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._failures = 0
+        self._remaining = None
+        self._reset_at = None
+
+        self.granted = 0
+        self.deferred = 0
+        self.backoffs = 0
+        self.waited_seconds = 0.0
+
+    # -------------------------------
+    # Acquiring permission to send
+    # -------------------------------
+
+    def acquire(self, priority=INTERACTIVE, max_wait=None):
+        """
+        Block until a request of this priority may be sent
+
+        Args:
+            priority: INTERACTIVE, BATCH or any int (lower goes first)
+            max_wait: Seconds to wait at most (default from self.max_wait)
+
+        Raises:
+            RateLimitDeferred: when the request would have to wait longer
+        """
+        if max_wait is None:
+            max_wait = self.max_wait.get(priority, self.max_wait[BATCH])
+        start = time.monotonic()
+        deadline = start + max_wait
+
+        with self._cond:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._queue, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._wait_time(now)
+                    if self._queue[0] == ticket and wait == 0:
+                        heapq.heappop(self._queue)
+                        self._tokens -= 1
+                        self.granted += 1
+                        self.waited_seconds += now - start
+                        self._cond.notify_all()
+                        return
+
+                    left = deadline - now
+                    if wait > left or left <= 0:
+                        self.record_deferral()
+                        raise RateLimitDeferred(max(wait, 1.0))
+
+                    # The head of the queue sleeps until a token is due; everyone else until notified
+                    self._cond.wait(timeout=min(wait, left) if self._queue[0] == ticket else left)
+            except BaseException:
+                if ticket in self._queue:
+                    self._queue.remove(ticket)
+                    heapq.heapify(self._queue)
+                    self._cond.notify_all()
+                raise
+
+    def record_deferral(self):
+        """Count a request given up on because of the rate limit (safe with the lock held)"""
+        with self._cond:
+            self.deferred += 1
+
+    def _wait_time(self, now):
+        """Seconds until the next token can be taken (lock held)"""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._refill_rate)
+        self._updated = now
+
+        if self._blocked_until > now:
+            return self._blocked_until - now
+        if self._tokens >= 1:
+            return 0
+        if self._refill_rate <= 0:
+            return self.max_backoff
+        return (1 - self._tokens) / self._refill_rate
+
+    # -------------------------------
+    # Learning from responses
+    # -------------------------------
+
+    def observe(self, status_code, headers):
+        """
+        Update pacing from a GitHub response
+
+        Returns:
+            Seconds to back off when the response was a rate-limit rejection, else None
+        """
+        headers = headers or {}
+        now = time.monotonic()
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset_at = _int_header(headers, "X-RateLimit-Reset")
+        retry_after = _int_header(headers, "Retry-After")
+
+        with self._cond:
+            until_reset = None
+            if remaining is not None and reset_at is not None:
+                self._remaining = remaining
+                self._reset_at = reset_at
+                until_reset = max(0.0, reset_at - time.time())
+                budget = remaining - self.reserve
+                if budget <= 0:
+                    self._blocked_until = max(self._blocked_until, now + until_reset)
+                else:
+                    self._refill_rate = min(self.rate, budget / max(until_reset, 1.0))
+
+            rate_limited = status_code == 429 or (
+                status_code == 403 and (remaining == 0 or retry_after is not None)
+            )
+            if not rate_limited:
+                if status_code < 400:
+                    self._failures = 0
+                self._cond.notify_all()
+                return None
+
+            self._failures += 1
+            self.backoffs += 1
+            # GitHub's own hints win; exponential backoff only when it gives none
+            if retry_after is not None:
+                delay = max(retry_after, self.base_backoff)
+            elif remaining == 0 and until_reset is not None:
+                delay = max(until_reset, self.base_backoff)
+            else:
+                delay = min(self.max_backoff, self.base_backoff * 2 ** (self._failures - 1))
+            self._blocked_until = max(self._blocked_until, now + delay)
+            self._cond.notify_all()
+            return delay
+
+    # -------------------------------
+    # Sending
+    # -------------------------------
+
+    def wrap(self, http, priority=INTERACTIVE, max_wait=None):
+        """requests module / Session look-alike whose get() goes through this scheduler"""
+        return ScheduledHTTP(self, http, priority, max_wait)
+
+    def stats(self):
+        """Counters and the last budget reported by GitHub"""
+        with self._cond:
+            now = time.monotonic()
+            self._wait_time(now)
+            return {
+                "granted": self.granted,
+                "deferred": self.deferred,
+                "backoffs": self.backoffs,
+                "waited_seconds": round(self.waited_seconds, 3),
+                "queued": len(self._queue),
+                "tokens": round(self._tokens, 2),
+                "refill_rate": round(self._refill_rate, 4),
+                "blocked_for": round(max(0.0, self._blocked_until - now), 1),
+                "remaining": self._remaining,
+                "reset_at": self._reset_at
+            }
+
+
+class ScheduledHTTP:
+    """Sends GET requests through a GitHubScheduler, backing off on 403/429"""
+
+    def __init__(self, scheduler, http, priority=INTERACTIVE, max_wait=None):
+        self.scheduler = scheduler
+        self.http = http
+        self.priority = priority
+        self.max_wait = scheduler.max_wait.get(priority, scheduler.max_wait[BATCH]) if max_wait is None else max_wait
+
+    def get(self, url, **kwargs):
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            self.scheduler.acquire(self.priority, max_wait=max(0.0, deadline - time.monotonic()))
+            response = self.http.get(url, **kwargs)
+            delay = self.scheduler.observe(response.status_code, response.headers)
+            if delay is None:
+                return response
+            if time.monotonic() + delay > deadline:
+                self.scheduler.record_deferral()
+                raise RateLimitDeferred(delay)
+
+
+def _int_header(headers, name):
+    value = headers.get(name)
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,341 @@
+# 🧪 CAREER NAVIGATOR - Local GitHub API Stand-in
+# Serves recorded /users/{u} and /users/{u}/repos fixtures for offline, reproducible load tests
+#
+# Usage:
+#   python github_standin.py --port 8787 --latency 0.05 --rate-limit 5000
+#   GITHUB_API_URL=http://127.0.0.1:8787 python data.py
+#
+#   # Capture real responses into the fixtures folder, then serve them
+#   python github_standin.py --record --port 8787
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "github")
+UPSTREAM_URL = "https://api.github.com"
+
+# Usernames like "synthetic-1500" get a generated profile with that many repos
+_SYNTHETIC_USER = re.compile(r"^synthetic-(\d+)$")
+_SYNTHETIC_LANGUAGES = ["Python", "Java", "JavaScript", "TypeScript", "C", "C++", "Go", "Rust", "Kotlin", None]
+
+
+class StandInConfig:
+    """Behaviour knobs of the stand-in server"""
+
+    def __init__(self, fixtures_dir=DEFAULT_FIXTURES_DIR, latency=0.0, jitter=0.0,
+                 rate_limit=5000, rate_window=3600, error_rate=0.0, error_statuses=(500, 502, 503),
+                 record=False, upstream_url=UPSTREAM_URL, seed=None):
+        """
+        Args:
+            fixtures_dir: Folder with users/{u}.json and users/{u}/repos.json
+            latency: Seconds added to every response
+            jitter: Extra random latency, uniform in [0, jitter]
+            rate_limit: Requests allowed per window (304 replies are free, as on GitHub)
+            rate_window: Length of a rate-limit window in seconds
+            error_rate: Fraction of requests answered with an injected error
+            error_statuses: Status codes used for injected errors
+            record: Fetch missing fixtures from upstream_url and save them
+            upstream_url: Real API used in record mode
+            seed: Seed for latency jitter and error injection
+        """
+        self.fixtures_dir = fixtures_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.record = record
+        self.upstream_url = upstream_url.rstrip("/")
+        self.random = random.Random(seed)
+
+        self.lock = threading.Lock()
+        self.window_start = time.time()
+        self.used = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.injected_errors = 0
+
+
+# -------------------------------
+# Fixtures (and record mode)
+# -------------------------------
+
+def _user_path(config, username):
+    return os.path.join(config.fixtures_dir, "users", f"{username}.json")
+
+
+def _repos_path(config, username):
+    return os.path.join(config.fixtures_dir, "users", username, "repos.json")
+
+
+def _synthetic_fixtures(username, repos_count):
+    user = {"login": username, "public_repos": repos_count, "type": "User"}
+    repos = [
+        {"name": f"repo-{i}", "full_name": f"{username}/repo-{i}",
+         "language": _SYNTHETIC_LANGUAGES[i % len(_SYNTHETIC_LANGUAGES)], "fork": False}
+        for i in range(repos_count)
+    ]
+    return user, repos
+
+
+def _write_json(path, document):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def record_user(config, username):
+    """
+    Capture a real user's profile and every repos page into the fixtures folder
+
+    Returns:
+        (user, repos), or (None, None) when upstream does not know the user
+    """
+    import requests
+
+    user_response = requests.get(f"{config.upstream_url}/users/{username}", timeout=10)
+    if user_response.status_code != 200:
+        return None, None
+
+    repos = []
+    url = f"{config.upstream_url}/users/{username}/repos?per_page=100"
+    while url:
+        response = requests.get(url, timeout=10)
+        if response.status_code != 200:
+            break
+        repos.extend(response.json())
+        url = response.links.get("next", {}).get("url")
+
+    user = user_response.json()
+    _write_json(_user_path(config, username), user)
+    _write_json(_repos_path(config, username), repos)
+    print(f"📼 Recorded {username}: {len(repos)} repos")
+    return user, repos
+
+
+def load_fixtures(config, username):
+    """(user, repos) for a username, or (None, None) when unknown"""
+    match = _SYNTHETIC_USER.match(username)
+    if match:
+        return _synthetic_fixtures(username, int(match.group(1)))
+
+    try:
+        with open(_user_path(config, username), encoding="utf-8") as f:
+            user = json.load(f)
+        try:
+            with open(_repos_path(config, username), encoding="utf-8") as f:
+                repos = json.load(f)
+        except FileNotFoundError:
+            repos = []
+        return user, repos
+    except FileNotFoundError:
+        if config.record:
+            return record_user(config, username)
+        return None, None
+
+
+# -------------------------------
+# HTTP handler
+# -------------------------------
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """GitHub-shaped responses for /users/{u} and /users/{u}/repos"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this keep-alive clients stall on delayed ACKs
+    disable_nagle_algorithm = True
+    config = None
+
+    def do_GET(self):
+        config = self.config
+
+        delay = config.latency + (config.random.uniform(0, config.jitter) if config.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        with config.lock:
+            config.requests += 1
+            if time.time() - config.window_start >= config.rate_window:
+                config.window_start = time.time()
+                config.used = 0
+            inject_error = config.error_rate and config.random.random() < config.error_rate
+            error_status = config.random.choice(config.error_statuses) if inject_error else None
+
+        if self._rate_limited():
+            self._send_json(403, {"message": "API rate limit exceeded", "documentation_url": "https://docs.github.com/rest"})
+            return
+
+        if error_status:
+            with config.lock:
+                config.injected_errors += 1
+            self._send_json(error_status, {"message": "Injected error"})
+            return
+
+        url = urlparse(self.path)
+        parts = url.path.strip("/").split("/")
+        if len(parts) not in (2, 3) or parts[0] != "users" or (len(parts) == 3 and parts[2] != "repos"):
+            self._send_json(404, {"message": "Not Found"})
+            return
+
+        user, repos = load_fixtures(config, parts[1])
+        if user is None:
+            self._send_json(404, {"message": "Not Found"})
+            return
+
+        if len(parts) == 2:
+            self._send_json(200, user, conditional=True)
+            return
+
+        query = parse_qs(url.query)
+        per_page = max(1, min(100, int(query.get("per_page", ["30"])[0])))
+        page = max(1, int(query.get("page", ["1"])[0]))
+        start = (page - 1) * per_page
+        last_page = max(1, -(-len(repos) // per_page))
+
+        links = []
+        base = f"http://{self.headers['Host']}/users/{parts[1]}/repos?per_page={per_page}"
+        if page < last_page:
+            links.append(f'<{base}&page={page + 1}>; rel="next"')
+            links.append(f'<{base}&page={last_page}>; rel="last"')
+        if page > 1:
+            links.append(f'<{base}&page={page - 1}>; rel="prev"')
+            links.append(f'<{base}&page=1>; rel="first"')
+
+        self._send_json(200, repos[start:start + per_page], conditional=True,
+                        extra_headers={"Link": ", ".join(links)} if links else None)
+
+    # -------------------------------
+    # Helpers
+    # -------------------------------
+
+    def _rate_limited(self):
+        with self.config.lock:
+            return self.config.used >= self.config.rate_limit
+
+    def _send_json(self, status, document, conditional=False, extra_headers=None):
+        config = self.config
+        payload = json.dumps(document).encode("utf-8")
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+
+        # Conditional hits are answered with 304 and, as on GitHub, do not use up the quota
+        if conditional and self.headers.get("If-None-Match") == etag:
+            with config.lock:
+                config.not_modified += 1
+            status, payload = 304, b""
+        elif status != 403:
+            with config.lock:
+                config.used += 1
+
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        if conditional:
+            self.send_header("ETag", etag)
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+
+        with config.lock:
+            remaining = max(0, config.rate_limit - config.used)
+            reset = int(config.window_start + config.rate_window)
+            used = config.used
+        self.send_header("X-RateLimit-Limit", str(config.rate_limit))
+        self.send_header("X-RateLimit-Remaining", str(remaining))
+        self.send_header("X-RateLimit-Reset", str(reset))
+        self.send_header("X-RateLimit-Used", str(used))
+        if status == 403:
+            self.send_header("Retry-After", str(max(0, reset - int(time.time()))))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_server(config=None, host="127.0.0.1", port=0):
+    """Build (but do not start) a stand-in server"""
+    config = config or StandInConfig()
+    handler = type("ConfiguredStandInHandler", (StandInHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+@contextlib.contextmanager
+def running_standin(config=None, host="127.0.0.1", port=0, patch_data=True):
+    """
+    Run the stand-in on a background thread
+
+    Args:
+        config: StandInConfig (default: bundled fixtures, no latency)
+        host / port: Bind address (port 0 picks a free port)
+        patch_data: Point data.GITHUB_API_URL at the stand-in while running
+
+    Yields:
+        Base URL of the stand-in
+    """
+    server = make_server(config, host=host, port=port)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://{host}:{server.server_port}"
+
+    previous = None
+    if patch_data:
+        import data
+        previous = data.GITHUB_API_URL
+        data.GITHUB_API_URL = base_url
+    try:
+        yield base_url
+    finally:
+        if patch_data:
+            data.GITHUB_API_URL = previous
+        server.shutdown()
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local GitHub API stand-in for offline load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="Fixtures folder")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency (seconds)")
+    parser.add_argument("--rate-limit", type=int, default=5000, help="Requests per window")
+    parser.add_argument("--rate-window", type=int, default=3600, help="Rate-limit window (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of injected errors")
+    parser.add_argument("--record", action="store_true", help="Capture missing users from the real API")
+    parser.add_argument("--seed", type=int, help="Seed for jitter and error injection")
+    args = parser.parse_args(argv)
+
+    config = StandInConfig(
+        fixtures_dir=args.fixtures, latency=args.latency, jitter=args.jitter,
+        rate_limit=args.rate_limit, rate_window=args.rate_window,
+        error_rate=args.error_rate, record=args.record, seed=args.seed
+    )
+    server = make_server(config, host=args.host, port=args.port)
+    print(f"🧪 GitHub stand-in on http://{args.host}:{server.server_port}")
+    print(f"   export GITHUB_API_URL=http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 {config.requests} requests, {config.not_modified} not modified, "
+              f"{config.injected_errors} injected errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+# 🗄️ CAREER NAVIGATOR - Persistent GitHub Response Cache
+# On-disk HTTP cache with ETag / Last-Modified revalidation and TTL + LRU eviction
+
+import json
+import sqlite3
+import threading
+import time
+
+
+class CachedResponse:
+    """Minimal response object served from the cache (mirrors requests.Response)"""
+
+    def __init__(self, status_code, content, headers, from_cache=True):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.from_cache = from_cache
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class GitHubResponseCache:
+    """
+    URL-keyed response cache stored in a single SQLite file
+
+    Fresh entries (younger than ttl) are served without touching the network.
+    Stale entries are revalidated with If-None-Match / If-Modified-Since, so a
+    304 reply is served locally and does not count against the rate limit.
+    When the stored bodies exceed max_bytes the least recently used are evicted.
+    """
+
+    # Response headers worth keeping alongside the body
+    KEPT_HEADERS = ("ETag", "Last-Modified", "Link")
+
+    def __init__(self, path=".github_cache.sqlite", ttl=3600, max_bytes=50 * 1024 * 1024):
+        """
+        Args:
+            path: SQLite file holding the cache
+            ttl: Seconds an entry is served without revalidation
+            max_bytes: Upper bound on the total size of cached bodies
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                headers TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_last_access ON responses (last_access)"
+        )
+        self._db.commit()
+
+    def get(self, http, url, timeout=10):
+        """
+        Fetch a URL through the cache
+
+        Args:
+            http: requests module or Session used for network calls
+            url: Absolute URL to fetch
+            timeout: Request timeout in seconds
+
+        Returns:
+            requests.Response for uncached replies, CachedResponse otherwise
+        """
+        now = time.time()
+        entry = self._lookup(url)
+
+        if entry and now - entry["stored_at"] < self.ttl:
+            self._touch(url, now, refresh=False)
+            self._count(hits=1)
+            return CachedResponse(200, entry["body"], entry["headers"])
+
+        # Stale or missing: ask GitHub, conditionally when we have validators
+        request_headers = {}
+        if entry:
+            if entry["headers"].get("ETag"):
+                request_headers["If-None-Match"] = entry["headers"]["ETag"]
+            if entry["headers"].get("Last-Modified"):
+                request_headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+
+        response = http.get(url, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and entry:
+            self._touch(url, now, refresh=True)
+            self._count(hits=1, revalidated=1)
+            return CachedResponse(200, entry["body"], entry["headers"])
+
+        self._count(misses=1)
+        if response.status_code == 200:
+            self._store(url, response, now)
+        return response
+
+    def stats(self):
+        """Hit / miss counters and current size, for sizing the cache"""
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes
+        }
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # -------------------------------
+    # Internal helpers
+    # -------------------------------
+
+    def _count(self, **increments):
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def _lookup(self, url):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, headers, stored_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"body": row[0], "headers": json.loads(row[1]), "stored_at": row[2]}
+
+    def _touch(self, url, now, refresh):
+        with self._lock:
+            if refresh:
+                self._db.execute(
+                    "UPDATE responses SET last_access = ?, stored_at = ? WHERE url = ?",
+                    (now, now, url)
+                )
+            else:
+                self._db.execute(
+                    "UPDATE responses SET last_access = ? WHERE url = ?", (now, url)
+                )
+            self._db.commit()
+
+    def _store(self, url, response, now):
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+
+        headers = {
+            name: response.headers[name]
+            for name in self.KEPT_HEADERS
+            if response.headers.get(name)
+        }
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (url, body, json.dumps(headers), len(body), now, now)
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (lock held)"""
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._db.execute(
+            "SELECT url, size FROM responses ORDER BY last_access ASC"
+        )
+        victims = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((url,))
+            total -= size
+
+        self._db.executemany("DELETE FROM responses WHERE url = ?", victims)
+        self.evictions += len(victims)
@@ -0,0 +1,322 @@
+# 📥 CAREER NAVIGATOR - Job Posting Ingester
+# Streams large job-posting CSV dumps in byte-range chunks and aggregates per-role
+# skill frequencies into a compact role catalog that load_job_requirements() can serve
+#
+# Usage:
+#   python ingest_postings.py postings.csv -o job_roles_generated.json --workers 4
+#   JOB_CATALOG_PATH=job_roles_generated.json streamlit run app.py
+#
+# Memory stays bounded by the chunk size plus the (role x skill) counters, not the
+# number of rows. With --checkpoint, an interrupted run picks up after the last
+# finished chunk. Rows must not contain line breaks inside quoted cells.
+
+import argparse
+import csv
+import json
+import os
+import re
+import time
+from collections import Counter
+
+from skills import REGISTRY
+
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+
+# Share of a role's postings a skill needs to count as required / nice to have
+REQUIRED_SHARE = 0.5
+NICE_SHARE = 0.2
+
+_whitespace = re.compile(r"\s+")
+
+
+# -------------------------------
+# Chunking
+# -------------------------------
+
+def _read_header(path):
+    with open(path, "rb") as f:
+        header_line = f.readline()
+        header = next(csv.reader([header_line.decode("utf-8-sig")]))
+        return [column.strip().lower() for column in header], f.tell()
+
+
+def plan_chunks(path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Split a CSV file into line-aligned byte ranges
+
+    Returns:
+        (header columns, list of (start, end) byte offsets)
+    """
+    columns, start = _read_header(path)
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as f:
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return columns, ranges
+
+
+def _process_chunk(path, start, end, columns, role_column, skills_column, experience_column):
+    """
+    Aggregate one byte range (runs in worker processes)
+
+    Returns:
+        (roles, spellings): role key -> {"names", "postings", "skills", "experience"}
+        counters, and a counter of raw skill spellings
+    """
+    role_index = columns.index(role_column)
+    skills_index = columns.index(skills_column)
+    experience_index = columns.index(experience_column) if experience_column in columns else None
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8", errors="replace")
+
+    roles = {}
+    spellings = Counter()
+    canonical_cache = {}
+    for row in csv.reader(text.splitlines()):
+        if len(row) <= max(role_index, skills_index):
+            continue
+        role_name = _whitespace.sub(" ", row[role_index]).strip()
+        if not role_name:
+            continue
+
+        entry = roles.get(role_name.lower())
+        if entry is None:
+            entry = roles[role_name.lower()] = _new_entry()
+        entry["postings"] += 1
+        entry["names"][role_name] += 1
+
+        seen = set()
+        for raw in row[skills_index].split(","):
+            raw = raw.strip()
+            if not raw:
+                continue
+            canonical = canonical_cache.get(raw)
+            if canonical is None:
+                canonical = canonical_cache[raw] = REGISTRY.canonical(raw)
+            if canonical not in seen:
+                seen.add(canonical)
+                spellings[raw] += 1
+        entry["skills"].update(seen)
+
+        if experience_index is not None and len(row) > experience_index and row[experience_index].strip():
+            entry["experience"][row[experience_index].strip()] += 1
+
+    return roles, spellings
+
+
+def _new_entry():
+    return {"postings": 0, "names": Counter(), "skills": Counter(), "experience": Counter()}
+
+
+def _merge(totals, partial):
+    roles, spellings = partial
+    totals["spellings"].update(spellings)
+    for key, entry in roles.items():
+        total = totals["roles"].get(key)
+        if total is None:
+            total = totals["roles"][key] = _new_entry()
+        total["postings"] += entry["postings"]
+        for counter in ("names", "skills", "experience"):
+            total[counter].update(entry[counter])
+
+
+def _empty_totals():
+    return {"roles": {}, "spellings": Counter()}
+
+
+# -------------------------------
+# Checkpoints
+# -------------------------------
+
+def _source_signature(path, chunk_bytes):
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            "chunk_bytes": chunk_bytes}
+
+
+def _load_checkpoint(checkpoint, signature):
+    try:
+        with open(checkpoint, encoding="utf-8") as f:
+            state = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return set(), _empty_totals()
+    if state.get("source") != signature:
+        print("⚠️  Checkpoint belongs to another file or chunk size. Starting over.")
+        return set(), _empty_totals()
+
+    totals = {"roles": {}, "spellings": Counter(state["spellings"])}
+    for key, entry in state["roles"].items():
+        totals["roles"][key] = {
+            "postings": entry["postings"],
+            **{counter: Counter(entry[counter]) for counter in ("names", "skills", "experience")}
+        }
+    return set(state["done"]), totals
+
+
+def _save_checkpoint(checkpoint, signature, done, totals):
+    state = {
+        "source": signature,
+        "done": sorted(done),
+        "spellings": dict(totals["spellings"]),
+        "roles": {
+            key: {"postings": entry["postings"], "names": dict(entry["names"]),
+                  "skills": dict(entry["skills"]), "experience": dict(entry["experience"])}
+            for key, entry in totals["roles"].items()
+        }
+    }
+    tmp_path = f"{checkpoint}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, checkpoint)
+
+
+# -------------------------------
+# Catalog output
+# -------------------------------
+
+def build_catalog(totals, required_share=REQUIRED_SHARE, nice_share=NICE_SHARE,
+                  max_required=12, max_nice=8, min_postings=1):
+    """
+    Turn aggregated counts into the job_roles.json document shape
+
+    Roles and skills are spelled the way most postings spell them. Each role
+    also carries its posting count and the posting share of every listed
+    skill ("skill_frequency"), so demand can be weighed later.
+    """
+    display = {}
+    for spelling, _ in totals["spellings"].most_common():
+        display.setdefault(REGISTRY.canonical(spelling), spelling)
+
+    roles = []
+    entries = [(entry["names"].most_common(1)[0][0], entry) for entry in totals["roles"].values()]
+    for name, entry in sorted(entries, key=lambda item: (-item[1]["postings"], item[0])):
+        postings = entry["postings"]
+        if postings < min_postings:
+            continue
+
+        ranked = sorted(entry["skills"].items(), key=lambda item: (-item[1], item[0]))
+        required = [skill for skill, count in ranked if count / postings >= required_share][:max_required]
+        if not required and ranked:
+            required = [ranked[0][0]]
+        nice = [
+            skill for skill, count in ranked
+            if skill not in required and count / postings >= nice_share
+        ][:max_nice]
+
+        experience = entry["experience"].most_common(1)
+        roles.append({
+            "role": name,
+            "required_skills": [display.get(skill, skill) for skill in required],
+            "nice_to_have": [display.get(skill, skill) for skill in nice],
+            "experience": experience[0][0] if experience else "0-2 years",
+            "postings": postings,
+            "skill_frequency": {
+                display.get(skill, skill): round(entry["skills"][skill] / postings, 4)
+                for skill in required + nice
+            }
+        })
+    return {"version": 1, "roles": roles}
+
+
+def ingest_postings(csv_path, output_path, chunk_bytes=DEFAULT_CHUNK_BYTES, workers=1, checkpoint=None,
+                    role_column="role", skills_column="required_skills", experience_column="experience",
+                    **catalog_options):
+    """
+    Stream a job-posting CSV into a role catalog file
+
+    Args:
+        csv_path: Posting dump with a role column and a comma-joined skills column
+        output_path: JSON catalog to write (load with JOB_CATALOG_PATH or load_job_requirements(path=...))
+        chunk_bytes: Approximate bytes per chunk
+        workers: Processes parsing chunks in parallel (1 = in this process)
+        checkpoint: Optional file recording finished chunks, for resuming after interruption
+        role_column / skills_column / experience_column: Header names (case-insensitive)
+        **catalog_options: Passed to build_catalog() (required_share, nice_share, ...)
+
+    Returns:
+        Dict with roles, postings, chunks and seconds
+    """
+    started = time.perf_counter()
+    columns, ranges = plan_chunks(csv_path, chunk_bytes)
+    role_column, skills_column, experience_column = (
+        role_column.lower(), skills_column.lower(), experience_column.lower()
+    )
+    for column in (role_column, skills_column):
+        if column not in columns:
+            raise ValueError(f"Column '{column}' not found in {csv_path} (columns: {columns})")
+
+    signature = _source_signature(csv_path, chunk_bytes)
+    done, totals = _load_checkpoint(checkpoint, signature) if checkpoint else (set(), _empty_totals())
+    pending = [(index, start, end) for index, (start, end) in enumerate(ranges) if index not in done]
+    if done:
+        print(f"♻️  Resuming: {len(done)}/{len(ranges)} chunks already ingested")
+
+    arguments = (columns, role_column, skills_column, experience_column)
+
+    def finish(index, partial):
+        _merge(totals, partial)
+        done.add(index)
+        if checkpoint:
+            _save_checkpoint(checkpoint, signature, done, totals)
+
+    if workers > 1 and len(pending) > 1:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_process_chunk, csv_path, start, end, *arguments): index
+                for index, start, end in pending
+            }
+            for future in as_completed(futures):
+                finish(futures[future], future.result())
+    else:
+        for index, start, end in pending:
+            finish(index, _process_chunk(csv_path, start, end, *arguments))
+
+    catalog = build_catalog(totals, **catalog_options)
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, indent=2)
+    os.replace(tmp_path, output_path)
+
+    if checkpoint and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    return {
+        "roles": len(catalog["roles"]),
+        "postings": sum(entry["postings"] for entry in totals["roles"].values()),
+        "chunks": len(ranges),
+        "seconds": round(time.perf_counter() - started, 2)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a role catalog from a job-posting CSV dump")
+    parser.add_argument("csv_path", help="Posting CSV (role, required_skills[, experience])")
+    parser.add_argument("-o", "--output", default="job_roles_generated.json", help="Catalog JSON to write")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parallel processes")
+    parser.add_argument("--chunk-mb", type=float, default=DEFAULT_CHUNK_BYTES / (1024 * 1024), help="Chunk size in MB")
+    parser.add_argument("--checkpoint", help="Checkpoint file for resuming an interrupted run")
+    parser.add_argument("--required-share", type=float, default=REQUIRED_SHARE)
+    parser.add_argument("--nice-share", type=float, default=NICE_SHARE)
+    parser.add_argument("--min-postings", type=int, default=1, help="Drop roles with fewer postings")
+    args = parser.parse_args(argv)
+
+    summary = ingest_postings(
+        args.csv_path, args.output,
+        chunk_bytes=int(args.chunk_mb * 1024 * 1024), workers=args.workers, checkpoint=args.checkpoint,
+        required_share=args.required_share, nice_share=args.nice_share, min_postings=args.min_postings
+    )
+    print(f"✅ {summary['postings']} postings -> {summary['roles']} roles in {summary['seconds']}s "
+          f"({summary['chunks']} chunks) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
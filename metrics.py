@@ -0,0 +1,215 @@
+# 📈 CAREER NAVIGATOR - Stage Timing & Metrics
+# Lightweight timing spans and counters with JSON-lines and Prometheus text exporters
+#
+# Disabled by default: span() hands back a shared no-op object and incr() returns
+# immediately, so instrumented code pays a flag check and nothing else.
+# Enable with NAVIGATOR_METRICS=1 or metrics.enable().
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+_enabled = os.environ.get("NAVIGATOR_METRICS", "").lower() in ("1", "true", "yes")
+_lock = threading.Lock()
+
+# Aggregates: span name -> {"count", "seconds", "max_seconds"} and event name -> total
+_spans = {}
+_counters = {}
+
+# Recent finished spans for the JSON-lines exporter
+EVENT_BUFFER_SIZE = 10000
+_events = deque(maxlen=EVENT_BUFFER_SIZE)
+
+
+def enable():
+    """Start recording spans and counters"""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording (already recorded data is kept until reset())"""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Drop everything recorded so far"""
+    with _lock:
+        _spans.clear()
+        _counters.clear()
+        _events.clear()
+
+
+class _NoopSpan:
+    """Stand-in returned while metrics are disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, counter, value=1):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """Times one stage execution and carries its counters"""
+
+    __slots__ = ("name", "labels", "counters", "_start")
+
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+        self.counters = {}
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self._start
+        event = {"ts": time.time(), "span": self.name, "seconds": round(seconds, 6)}
+        if self.labels:
+            event["labels"] = self.labels
+        if self.counters:
+            event["counters"] = self.counters
+        if exc_type is not None:
+            event["error"] = exc_type.__name__
+
+        with _lock:
+            stats = _spans.setdefault(self.name, {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+            stats["count"] += 1
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            for counter, value in self.counters.items():
+                _counters[counter] = _counters.get(counter, 0) + value
+            _events.append(event)
+        return False
+
+    def add(self, counter, value=1):
+        """Add to a counter carried by this span (e.g. bytes_parsed)"""
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+
+def span(name, **labels):
+    """
+    Time a pipeline stage
+
+    Usage:
+        with metrics.span("pdf_page_extraction") as s:
+            s.add("bytes_parsed", len(text))
+    """
+    if not _enabled:
+        return _NOOP_SPAN
+    return Span(name, labels)
+
+
+def timed(name):
+    """Decorator form of span() for whole functions"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with Span(name, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def incr(counter, value=1):
+    """Bump a standalone counter (cache hits, mock fallbacks, ...)"""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[counter] = _counters.get(counter, 0) + value
+
+
+def snapshot():
+    """Current aggregates as plain dicts"""
+    with _lock:
+        return {
+            "spans": {name: dict(stats) for name, stats in _spans.items()},
+            "counters": dict(_counters)
+        }
+
+
+# -------------------------------
+# Exporters
+# -------------------------------
+
+def export_jsonl(destination, clear=True):
+    """
+    Write buffered span events as JSON lines
+
+    Args:
+        destination: File path (appended to) or writable text file object
+        clear: Drop the exported events from the buffer
+
+    Returns:
+        Number of events written
+    """
+    with _lock:
+        events = list(_events)
+        if clear:
+            _events.clear()
+
+    lines = "".join(json.dumps(event) + "\n" for event in events)
+    if hasattr(destination, "write"):
+        destination.write(lines)
+    else:
+        with open(destination, "a", encoding="utf-8") as f:
+            f.write(lines)
+    return len(events)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(prefix="navigator"):
+    """Aggregates in the Prometheus text exposition format"""
+    current = snapshot()
+    lines = [
+        f"# HELP {prefix}_stage_seconds Time spent in each pipeline stage",
+        f"# TYPE {prefix}_stage_seconds summary"
+    ]
+    for name, stats in sorted(current["spans"].items()):
+        lines.append(f'{prefix}_stage_seconds_sum{{stage="{_label(name)}"}} {stats["seconds"]:.6f}')
+        lines.append(f'{prefix}_stage_seconds_count{{stage="{_label(name)}"}} {stats["count"]}')
+
+    lines += [
+        f"# HELP {prefix}_stage_max_seconds Slowest single run of each pipeline stage",
+        f"# TYPE {prefix}_stage_max_seconds gauge"
+    ]
+    for name, stats in sorted(current["spans"].items()):
+        lines.append(f'{prefix}_stage_max_seconds{{stage="{_label(name)}"}} {stats["max_seconds"]:.6f}')
+
+    lines += [
+        f"# HELP {prefix}_events_total Counters such as cache hits, mock fallbacks and bytes parsed",
+        f"# TYPE {prefix}_events_total counter"
+    ]
+    for name, value in sorted(current["counters"].items()):
+        lines.append(f'{prefix}_events_total{{event="{_label(name)}"}} {value}')
+
+    return "\n".join(lines) + "\n"
+
+
+def export_prometheus(path, prefix="navigator"):
+    """Write prometheus_text() to a file (e.g. for node_exporter's textfile collector)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(prometheus_text(prefix))
+    os.replace(tmp_path, path)
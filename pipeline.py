@@ -0,0 +1,191 @@
+# 🔁 CAREER NAVIGATOR - Incremental Analysis Pipeline
+# Memoized stage graph: fetch -> extract skills -> gap analysis -> roadmap
+# Each stage is fingerprinted by its inputs, so only stages whose inputs changed re-run
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import data
+from agents import analyze_skill_gaps, extract_all_skills_from_data, generate_roadmap
+
+
+def fingerprint(value):
+    """Stable content hash of a stage input"""
+    if isinstance(value, (bytes, bytearray)):
+        return hashlib.sha256(value).hexdigest()
+    encoded = json.dumps(value, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class Stage:
+    """
+    One memoized step of the pipeline
+
+    The stage function is called with the outputs of its upstream stages
+    (in `deps` order) followed by its raw inputs (in `params` order).
+    """
+
+    def __init__(self, name, func, deps=(), params=(), ttl=None, max_entries=64, cache_if=None):
+        """
+        Args:
+            name: Stage name, also the key of its output in run() results
+            func: Function computing the stage output
+            deps: Names of upstream stages whose outputs are passed in
+            params: Names of raw pipeline inputs passed in
+            ttl: Optional seconds after which a memoized output is recomputed
+            max_entries: Outputs remembered per stage (least recently used evicted)
+            cache_if: Optional function(output) -> bool; rejected outputs are not memoized,
+                and neither is anything computed from them downstream
+        """
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.params = tuple(params)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache_if = cache_if
+
+
+class StageGraph:
+    """
+    Runs stages in dependency order, re-running only those whose inputs changed
+
+    A stage's fingerprint combines the fingerprints of its raw inputs and of
+    its upstream stages' outputs, so e.g. changing only `hours` invalidates
+    just the roadmap stage, and a stage that re-runs (TTL expiry) only
+    invalidates its dependants when it actually returns something new.
+    Memoized outputs are shared between callers: treat them as read-only.
+    """
+
+    def __init__(self, stages):
+        self.stages = OrderedDict()
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown or later stages: {missing}")
+            self.stages[stage.name] = stage
+
+        self._memo = {name: OrderedDict() for name in self.stages}
+        self._stats = {name: {"hits": 0, "misses": 0, "last_ms": 0.0} for name in self.stages}
+        self._lock = threading.Lock()
+
+    def run(self, **inputs):
+        """
+        Run the pipeline for a set of raw inputs
+
+        Returns:
+            Dict of stage name -> output
+        """
+        input_prints = {}
+        output_prints = {}
+        outputs = {}
+        uncached = set()  # Stages whose output must not be memoized (nor anything built on it)
+
+        for name, stage in self.stages.items():
+            for param in stage.params:
+                if param not in input_prints:
+                    input_prints[param] = fingerprint(inputs.get(param))
+
+            stage_print = fingerprint([
+                name,
+                [output_prints[dep] for dep in stage.deps],
+                [input_prints[param] for param in stage.params]
+            ])
+
+            if any(dep in uncached for dep in stage.deps):
+                uncached.add(name)
+                hit = False
+                with self._lock:
+                    self._stats[name]["misses"] += 1
+            else:
+                hit, output, output_print = self._lookup(stage, stage_print)
+            if not hit:
+                start = time.perf_counter()
+                args = [outputs[dep] for dep in stage.deps] + [inputs.get(param) for param in stage.params]
+                output = stage.func(*args)
+                output_print = fingerprint(output)
+                if stage.cache_if is not None and not stage.cache_if(output):
+                    uncached.add(name)
+                if name not in uncached:
+                    self._store(stage, stage_print, output, output_print, (time.perf_counter() - start) * 1000)
+            outputs[name] = output
+            output_prints[name] = output_print
+
+        return outputs
+
+    def stats(self):
+        """Per-stage hit / miss counters and last compute time (ms)"""
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def clear(self):
+        """Forget every memoized output"""
+        with self._lock:
+            for memo in self._memo.values():
+                memo.clear()
+
+    def _lookup(self, stage, stage_print):
+        with self._lock:
+            memo = self._memo[stage.name]
+            entry = memo.get(stage_print)
+            if entry is not None:
+                output, output_print, stored_at = entry
+                if stage.ttl is None or time.time() - stored_at < stage.ttl:
+                    memo.move_to_end(stage_print)
+                    self._stats[stage.name]["hits"] += 1
+                    return True, output, output_print
+                del memo[stage_print]
+            self._stats[stage.name]["misses"] += 1
+            return False, None, None
+
+    def _store(self, stage, stage_print, output, output_print, elapsed_ms):
+        with self._lock:
+            memo = self._memo[stage.name]
+            memo[stage_print] = (output, output_print, time.time())
+            while len(memo) > stage.max_entries:
+                memo.popitem(last=False)
+            self._stats[stage.name]["last_ms"] = round(elapsed_ms, 3)
+
+
+def _fetch_github(github_user, session=None):
+    return data.get_github_skills(github_user, session=session) if github_user else None
+
+
+def _parse_resume(resume_bytes):
+    return data.extract_resume_skills(resume_bytes) if resume_bytes else None
+
+
+def _analyze_gaps(skills, role):
+    return analyze_skill_gaps(skills, data.load_job_requirements(role))
+
+
+def build_navigator_pipeline(fetch_github=None, parse_resume=None, session=None, github_ttl=600):
+    """
+    The navigator's analysis pipeline as a memoized stage graph
+
+    Inputs to run(): github_user, resume_bytes, role, hours, level
+
+    Args:
+        fetch_github: Optional function(username) replacing data.get_github_skills
+        parse_resume: Optional function(pdf_bytes) replacing data.extract_resume_skills
+        session: Optional requests.Session for the default GitHub fetcher
+        github_ttl: Seconds before a memoized GitHub profile is fetched again
+
+    Returns:
+        StageGraph with stages github, resume, skills, gaps, roadmap
+    """
+    fetch_github = fetch_github or (lambda github_user: _fetch_github(github_user, session=session))
+    parse_resume = parse_resume or _parse_resume
+
+    return StageGraph([
+        # Rate-limit deferrals (and everything derived from them) are recomputed on the next run
+        Stage("github", fetch_github, params=["github_user"], ttl=github_ttl,
+              cache_if=lambda profile: not data.is_deferred(profile)),
+        Stage("resume", parse_resume, params=["resume_bytes"]),
+        Stage("skills", extract_all_skills_from_data, deps=["github", "resume"]),
+        Stage("gaps", _analyze_gaps, deps=["skills"], params=["role"]),
+        Stage("roadmap", generate_roadmap, deps=["gaps"], params=["hours", "level"])
+    ])
@@ -0,0 +1,194 @@
+# 🧭 CAREER NAVIGATOR - Skill Prerequisite Graph
+# Compiled prerequisite DAG with a precomputed transitive closure and per-skill effort
+# estimates, so roadmaps learn Java before Spring Boot and fill days by hours, not counts
+#
+# skill_prerequisites.json:
+#   {"default_hours": 2, "level_factor": {"Beginner": 1.0, ...},
+#    "skills": {"spring boot": {"requires": ["java", "rest apis"], "hours": 3}, ...}}
+
+import heapq
+import json
+import os
+from functools import lru_cache
+
+from skills import REGISTRY
+
+DEFAULT_PREREQUISITES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_prerequisites.json")
+
+ORDER_CACHE_SIZE = 1024
+
+
+class PrerequisiteGraph:
+    """
+    Skill prerequisite DAG compiled once into bitsets
+
+    Every skill is a node numbered by its position in one global topological
+    order. ancestors[i] / descendants[i] are Python ints with bit j set when
+    node j is a direct or indirect prerequisite / dependant of node i, so
+    ordering a gap set never walks the graph: it masks two ints per skill.
+    Orders are cached per gap tuple, which repeats a lot across a cohort.
+    """
+
+    def __init__(self, skills=None, default_hours=2.0, level_factor=None):
+        """
+        Args:
+            skills: Dict of skill -> {"requires": [skill, ...], "hours": float}
+            default_hours: Effort of skills without an estimate
+            level_factor: Dict of level -> multiplier applied to every estimate
+
+        Raises:
+            ValueError: when the prerequisites contain a cycle
+        """
+        self.default_hours = float(default_hours)
+        self.level_factor = dict(level_factor or {})
+
+        requires = {}
+        self._hours = {}
+        for skill, spec in (skills or {}).items():
+            skill_id = REGISTRY.skill_id(skill)
+            requires.setdefault(skill_id, set()).update(REGISTRY.ids(spec.get("requires", ())))
+            if "hours" in spec:
+                self._hours[skill_id] = float(spec["hours"])
+            for prerequisite in requires[skill_id]:
+                requires.setdefault(prerequisite, set())
+
+        self._nodes = _topological_order(requires)
+        self._index = {skill_id: i for i, skill_id in enumerate(self._nodes)}
+
+        # Closures in topological order: every prerequisite is finished before its dependants
+        self._ancestors = [0] * len(self._nodes)
+        for i, skill_id in enumerate(self._nodes):
+            bits = 0
+            for prerequisite in requires[skill_id]:
+                j = self._index[prerequisite]
+                bits |= self._ancestors[j] | (1 << j)
+            self._ancestors[i] = bits
+
+        self._descendants = [0] * len(self._nodes)
+        for i, bits in enumerate(self._ancestors):
+            for j in _bits(bits):
+                self._descendants[j] |= 1 << i
+
+        self._order = lru_cache(maxsize=ORDER_CACHE_SIZE)(self._order_uncached)
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_PREREQUISITES_PATH):
+        """Build a graph from a JSON prerequisite file"""
+        with open(path, encoding="utf-8") as f:
+            document = json.load(f)
+        return cls(document.get("skills", {}), document.get("default_hours", 2.0),
+                   document.get("level_factor"))
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def prerequisites(self, skill_id):
+        """IDs of every direct or indirect prerequisite of a skill, in learning order"""
+        i = self._index.get(skill_id)
+        return tuple(self._nodes[j] for j in _bits(self._ancestors[i])) if i is not None else ()
+
+    def hours(self, skill_id, level="Beginner"):
+        """Estimated hours to get started with a skill at a level (multiples of half an hour)"""
+        hours = self._hours.get(skill_id, self.default_hours) * self.level_factor.get(level, 1.0)
+        return max(0.5, round(hours * 2) / 2)
+
+    def order(self, skill_ids):
+        """
+        Order skills so prerequisites come first
+
+        Only prerequisite relations between the given skills matter (directly
+        or through skills that are not in the list). Otherwise the input
+        order is kept, so callers list what matters most first.
+
+        Args:
+            skill_ids: Iterable of skill IDs (duplicates are dropped)
+
+        Returns:
+            Tuple of skill IDs
+        """
+        return self._order(tuple(skill_ids))
+
+    def _order_uncached(self, skill_ids):
+        position = {}
+        for skill_id in skill_ids:
+            position.setdefault(skill_id, len(position))
+
+        index, ancestors, descendants, nodes = self._index, self._ancestors, self._descendants, self._nodes
+        mask = 0
+        for skill_id in position:
+            i = index.get(skill_id)
+            if i is not None:
+                mask |= 1 << i
+
+        # Kahn's algorithm over the gap set, picking the earliest listed skill that is free
+        blocked = {}
+        ready = []
+        for skill_id, pos in position.items():
+            i = index.get(skill_id)
+            count = (ancestors[i] & mask).bit_count() if i is not None else 0
+            if count:
+                blocked[skill_id] = count
+            else:
+                ready.append((pos, skill_id))
+        heapq.heapify(ready)
+
+        ordered = []
+        while ready:
+            _, skill_id = heapq.heappop(ready)
+            ordered.append(skill_id)
+            i = index.get(skill_id)
+            if i is None:
+                continue
+            for j in _bits(descendants[i] & mask):
+                dependant = nodes[j]
+                blocked[dependant] -= 1
+                if not blocked[dependant]:
+                    del blocked[dependant]
+                    heapq.heappush(ready, (position[dependant], dependant))
+        return tuple(ordered)
+
+
+def _bits(bits):
+    """Indices of the set bits of an int, lowest first"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def _topological_order(requires):
+    """Skill IDs with prerequisites first, ties broken by name so the order is stable"""
+    waiting = {skill_id: len(prerequisites) for skill_id, prerequisites in requires.items()}
+    dependants = {}
+    for skill_id, prerequisites in requires.items():
+        for prerequisite in prerequisites:
+            dependants.setdefault(prerequisite, []).append(skill_id)
+
+    ready = [(REGISTRY.name(skill_id), skill_id) for skill_id, count in waiting.items() if not count]
+    heapq.heapify(ready)
+    ordered = []
+    while ready:
+        _, skill_id = heapq.heappop(ready)
+        ordered.append(skill_id)
+        for dependant in dependants.get(skill_id, ()):
+            waiting[dependant] -= 1
+            if not waiting[dependant]:
+                heapq.heappush(ready, (REGISTRY.name(dependant), dependant))
+
+    if len(ordered) != len(requires):
+        cycle = sorted(REGISTRY.name(skill_id) for skill_id, count in waiting.items() if count)
+        raise ValueError(f"Skill prerequisites contain a cycle through: {', '.join(cycle)}")
+    return ordered
+
+
+_graph = None
+
+
+def get_prerequisite_graph():
+    """Graph from $SKILL_PREREQUISITES_PATH or the bundled file, compiled on first use"""
+    global _graph
+    if _graph is None:
+        _graph = PrerequisiteGraph.from_file(
+            os.environ.get("SKILL_PREREQUISITES_PATH") or DEFAULT_PREREQUISITES_PATH
+        )
+    return _graph
@@ -0,0 +1,376 @@
+# 🧱 CAREER NAVIGATOR - Compact Profile Records
+# Frozen, slotted records for GitHub profiles, resume profiles and gap results,
+# with skills held as interned-ID arrays and a compact binary serialization
+#
+# The dict shapes returned by data.py / agents.py stay available: every record
+# reads like its dict (record["skills"], record.get(...), "skills" in record)
+# and to_dict() / from_dict() convert both ways. Profiles remember a skill's
+# spelling only where it differs from the registry's display name, so to_dict()
+# gives back what from_dict() was given while the ID array stays the storage;
+# aliases of one skill ("Node", "Node.js") still collapse into the first.
+
+import marshal
+import sys
+from array import array
+from dataclasses import dataclass
+
+from skills import REGISTRY
+
+MAGIC = b"CNR1"
+
+# Record type tags in the binary format
+_GITHUB, _RESUME, _GAPS = 1, 2, 3
+
+
+def _ids(skills):
+    """Compact, order-preserving array of unique skill IDs"""
+    return _ids_and_spellings(skills)[0]
+
+
+def _ids_and_spellings(skills):
+    """
+    Unique skill IDs in input order, plus ((index, spelling), ...) for the
+    skills given in another spelling than the registry's display name
+    """
+    seen = set()
+    ids = array("I")
+    spellings = []
+    for skill in skills or ():
+        if not skill or not skill.strip():
+            continue
+        skill_id = REGISTRY.skill_id(skill)
+        if skill_id not in seen:
+            seen.add(skill_id)
+            if skill != REGISTRY.display_name(skill_id):
+                spellings.append((len(ids), sys.intern(skill)))
+            ids.append(skill_id)
+    return ids, tuple(spellings)
+
+
+def _spelled(skill_ids, spellings, start=0):
+    """Skill names for skill_ids[start:start + len(skill_ids)] with the record's own spellings applied"""
+    names = REGISTRY.display_names(skill_ids)
+    for index, spelling in spellings:
+        if start <= index < start + len(names):
+            names[index - start] = spelling
+    return names
+
+
+class _DictShape:
+    """Read-only dict access on top of to_dict(), for callers written against the old shape"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return self.to_dict()[key]
+
+    def __contains__(self, key):
+        return key in self.to_dict()
+
+    def get(self, key, default=None):
+        return self.to_dict().get(key, default)
+
+    def keys(self):
+        return self.to_dict().keys()
+
+
+# -------------------------------
+# 🐙 GitHub profile
+# -------------------------------
+
+@dataclass(frozen=True, slots=True)
+class GitHubProfile(_DictShape):
+    """One get_github_skills() result"""
+
+    username: str
+    repos_count: int
+    experience_level: str | None
+    activity_level: str | None
+    top_languages: tuple   # ((language, percent), ...) in display order
+    skill_ids: array
+    spellings: tuple       # ((index into skill_ids, spelling), ...) where it differs from the display name
+    status: str = "ok"
+    retry_after: int = 0
+
+    @classmethod
+    def from_dict(cls, github_data):
+        skill_ids, spellings = _ids_and_spellings(github_data.get("skills"))
+        return cls(
+            username=github_data["username"],
+            repos_count=github_data.get("repos_count", 0),
+            experience_level=github_data.get("experience_level"),
+            activity_level=github_data.get("activity_level"),
+            top_languages=tuple(
+                (language, int(str(percent).rstrip("%") or 0))
+                for language, percent in github_data.get("top_languages", {}).items()
+            ),
+            skill_ids=skill_ids,
+            spellings=spellings,
+            status=github_data.get("status", "ok"),
+            retry_after=github_data.get("retry_after", 0)
+        )
+
+    @property
+    def skills(self):
+        return _spelled(self.skill_ids, self.spellings)
+
+    def to_dict(self):
+        result = {
+            "username": self.username,
+            "repos_count": self.repos_count,
+            "experience_level": self.experience_level,
+            "top_languages": {language: f"{percent}%" for language, percent in self.top_languages},
+            "skills": self.skills,
+            "activity_level": self.activity_level
+        }
+        if self.status != "ok":
+            result["status"] = self.status
+            result["retry_after"] = self.retry_after
+        return result
+
+
+# -------------------------------
+# 📄 Resume profile
+# -------------------------------
+
+@dataclass(frozen=True, slots=True)
+class ResumeProfile(_DictShape):
+    """
+    One extract_resume_skills() result
+
+    technical_skills is stored CSR-style: all skill IDs in one array, with
+    category_ends[i] marking where categories[i] stops.
+    """
+
+    name: str
+    degree: str
+    institution: str
+    year: str
+    cgpa: float
+    categories: tuple
+    category_ends: array
+    skill_ids: array
+    spellings: tuple       # ((index into skill_ids, spelling), ...) where it differs from the display name
+    projects: tuple        # ((title, type, (tech, ...)), ...)
+    interests: tuple
+    strengths: tuple
+
+    @classmethod
+    def from_dict(cls, resume_data):
+        education = resume_data.get("education", {})
+        categories = []
+        category_ends = array("I")
+        skill_ids = array("I")
+        spellings = []
+        for category, skills in resume_data.get("technical_skills", {}).items():
+            ids, own = _ids_and_spellings(skills)
+            spellings.extend((len(skill_ids) + index, spelling) for index, spelling in own)
+            categories.append(category)
+            skill_ids.extend(ids)
+            category_ends.append(len(skill_ids))
+
+        return cls(
+            name=resume_data.get("name", ""),
+            degree=education.get("degree", ""),
+            institution=education.get("institution", ""),
+            year=education.get("year", ""),
+            cgpa=float(education.get("cgpa") or 0.0),
+            categories=tuple(categories),
+            category_ends=category_ends,
+            skill_ids=skill_ids,
+            spellings=tuple(spellings),
+            projects=tuple(
+                (project.get("title", ""), project.get("type", ""), tuple(project.get("tech", ())))
+                for project in resume_data.get("projects", ())
+            ),
+            interests=tuple(resume_data.get("interests", ())),
+            strengths=tuple(resume_data.get("strengths", ()))
+        )
+
+    @property
+    def technical_skills(self):
+        result = {}
+        start = 0
+        for category, end in zip(self.categories, self.category_ends):
+            result[category] = _spelled(self.skill_ids[start:end], self.spellings, start)
+            start = end
+        return result
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "education": {
+                "degree": self.degree,
+                "institution": self.institution,
+                "year": self.year,
+                "cgpa": self.cgpa
+            },
+            "technical_skills": self.technical_skills,
+            "projects": [
+                {"title": title, "tech": list(tech), "type": kind}
+                for title, kind, tech in self.projects
+            ],
+            "interests": list(self.interests),
+            "strengths": list(self.strengths)
+        }
+
+
+# -------------------------------
+# 🎯 Gap result
+# -------------------------------
+
+@dataclass(frozen=True, slots=True)
+class GapResult(_DictShape):
+    """One analyze_skill_gaps() result"""
+
+    missing_required_ids: array
+    missing_nice_ids: array
+    matched_ids: array
+
+    @classmethod
+    def from_dict(cls, gaps):
+        return cls(
+            missing_required_ids=_ids(gaps.get("missing_required")),
+            missing_nice_ids=_ids(gaps.get("missing_nice_to_have")),
+            matched_ids=_ids(gaps.get("matched_skills"))
+        )
+
+    @property
+    def gap_count(self):
+        return len(self.missing_required_ids)
+
+    @property
+    def match_count(self):
+        return len(self.matched_ids)
+
+    def to_dict(self):
+        return {
+            "missing_required": REGISTRY.names(self.missing_required_ids),
+            "missing_nice_to_have": REGISTRY.names(self.missing_nice_ids),
+            "matched_skills": REGISTRY.names(self.matched_ids),
+            "gap_count": self.gap_count,
+            "match_count": self.match_count
+        }
+
+
+# -------------------------------
+# 💾 Binary serialization
+# -------------------------------
+#
+# Records are flattened to tuples of primitives with skill-ID arrays as raw
+# bytes, then written with marshal (C speed, no code execution on load).
+# Skill IDs are process-local, so each payload carries the display names of
+# the IDs it uses; loading in another process re-interns them, remaps the
+# arrays and keeps the writer's display names as spellings where they differ.
+
+def _as_row(record):
+    if isinstance(record, GitHubProfile):
+        return (_GITHUB, record.username, record.repos_count, record.experience_level,
+                record.activity_level, record.top_languages, record.skill_ids.tobytes(),
+                record.spellings, record.status, record.retry_after)
+    if isinstance(record, ResumeProfile):
+        return (_RESUME, record.name, record.degree, record.institution, record.year, record.cgpa,
+                record.categories, record.category_ends.tobytes(), record.skill_ids.tobytes(),
+                record.spellings, record.projects, record.interests, record.strengths)
+    if isinstance(record, GapResult):
+        return (_GAPS, record.missing_required_ids.tobytes(), record.missing_nice_ids.tobytes(),
+                record.matched_ids.tobytes())
+    raise TypeError(f"Cannot serialize {type(record).__name__}")
+
+
+def _skill_arrays(record):
+    if isinstance(record, GapResult):
+        return (record.missing_required_ids, record.missing_nice_ids, record.matched_ids)
+    return (record.skill_ids,)
+
+
+def dumps(records):
+    """
+    Serialize records to bytes
+
+    Args:
+        records: One record or an iterable of GitHubProfile / ResumeProfile / GapResult
+
+    Returns:
+        Bytes for loads()
+    """
+    if isinstance(records, _DictShape):
+        records = (records,)
+
+    rows = []
+    used = set()
+    for record in records:
+        rows.append(_as_row(record))
+        for skill_ids in _skill_arrays(record):
+            used.update(skill_ids)
+
+    used = sorted(used)
+    table = (array("I", used).tobytes(), tuple(REGISTRY.display_names(used)))
+    return MAGIC + marshal.dumps((sys.byteorder, table, tuple(rows)), 4)
+
+
+def loads(payload):
+    """
+    Deserialize bytes written by dumps()
+
+    Returns:
+        List of records
+    """
+    if bytes(payload[:len(MAGIC)]) != MAGIC:
+        raise ValueError("Not a career navigator record payload")
+    byteorder, (stored_ids, names), rows = marshal.loads(payload[len(MAGIC):])
+    swap = byteorder != sys.byteorder
+
+    stored = _array(stored_ids, swap)
+    remap = {old: REGISTRY.skill_id(name) for old, name in zip(stored, names)}
+    # Writer display names this process spells differently become per-record spellings
+    respelled = {
+        old: name for old, name in zip(stored, names) if name != REGISTRY.display_name(remap[old])
+    }
+    if all(old == new for old, new in remap.items()):
+        remap = None
+
+    def skills(raw):
+        result = _array(raw, swap)
+        return array("I", map(remap.__getitem__, result)) if remap else result
+
+    def profile_skills(raw, spellings):
+        if not respelled:
+            return skills(raw), spellings
+        own = dict(spellings)
+        for index, old in enumerate(_array(raw, swap)):
+            if index not in own and old in respelled:
+                own[index] = respelled[old]
+        return skills(raw), tuple(sorted(own.items()))
+
+    records = []
+    for row in rows:
+        tag = row[0]
+        if tag == _GITHUB:
+            (_, username, repos_count, experience_level, activity_level, top_languages, raw, spellings,
+             status, retry_after) = row
+            records.append(GitHubProfile(username, repos_count, experience_level, activity_level,
+                                         top_languages, *profile_skills(raw, spellings), status, retry_after))
+        elif tag == _RESUME:
+            (_, name, degree, institution, year, cgpa, categories, ends, raw, spellings,
+             projects, interests, strengths) = row
+            records.append(ResumeProfile(name, degree, institution, year, cgpa, categories, _array(ends, swap),
+                                         *profile_skills(raw, spellings), projects, interests, strengths))
+        elif tag == _GAPS:
+            records.append(GapResult(skills(row[1]), skills(row[2]), skills(row[3])))
+        else:
+            raise ValueError(f"Unknown record type {tag}")
+    return records
+
+
+def _array(raw, swap):
+    result = array("I")
+    result.frombytes(raw)
+    if swap:
+        result.byteswap()
+    return result
+
+
+def as_dict(value):
+    """Dict shape of a record; dicts and None pass through unchanged"""
+    return value.to_dict() if isinstance(value, _DictShape) else value
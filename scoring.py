@@ -0,0 +1,137 @@
+# 🧮 CAREER NAVIGATOR - Vectorized Match Scoring Engine
+# Users x roles match matrices for cohort reports, computed with batched NumPy operations
+
+import numpy as np
+
+from catalog import RoleWeights, get_job_catalog
+from skills import REGISTRY
+
+
+class SkillMatrixEngine:
+    """
+    Scores many users against many roles at once
+
+    Required skill IDs of every role form a fixed vocabulary. Roles become a
+    boolean (roles x vocabulary) matrix and each batch of users a boolean
+    (users x vocabulary) matrix, so matched counts for every pair come from a
+    single matrix product. Results are identical to calling
+    agents.calculate_match_score() for each (user, role) pair.
+    """
+
+    def __init__(self, roles, chunk_size=4096):
+        """
+        Args:
+            roles: Dict of role name -> requirements dict (e.g. load_job_requirements())
+            chunk_size: Users encoded per batch, bounds peak memory
+        """
+        self.chunk_size = chunk_size
+        self.role_names = list(roles)
+
+        role_sets = []
+        role_weights = []
+        for name in self.role_names:
+            role = roles[name]
+            required_ids = getattr(role, 'required_ids', None)
+            if required_ids is None:
+                required_ids = REGISTRY.ids(role.get('required_skills', []))
+            role_sets.append(required_ids)
+            weights = getattr(role, 'weights', None)
+            if weights is None:
+                weights = RoleWeights(required_ids, role.get('skill_weights'), role.get('skill_frequency'))
+            role_weights.append(weights)
+
+        # Interned skill ID -> column
+        self.vocabulary = {}
+        for required_ids in role_sets:
+            for skill_id in sorted(required_ids):
+                self.vocabulary.setdefault(skill_id, len(self.vocabulary))
+
+        self.role_matrix = np.zeros((len(role_sets), len(self.vocabulary)), dtype=bool)
+        for row, required_ids in enumerate(role_sets):
+            self.role_matrix[row, [self.vocabulary[i] for i in required_ids]] = True
+
+        self.total_required = self.role_matrix.sum(axis=1).astype(np.int32)
+        # float32 operand for BLAS; exact for any realistic number of skills (< 2**24)
+        self._role_operand = self.role_matrix.T.astype(np.float32)
+
+        # Dense demand weights (vocabulary x roles), used by score(weighted=True)
+        self._weight_operand = np.zeros((len(self.vocabulary), len(role_sets)), dtype=np.float64)
+        for column, weights in enumerate(role_weights):
+            for skill_id, weight in weights.by_id.items():
+                self._weight_operand[self.vocabulary[skill_id], column] = weight
+        self.total_weight = np.array([weights.total for weights in role_weights], dtype=np.float64)
+
+        # Percentages are looked up, not recomputed, so rounding matches
+        # calculate_match_score() bit for bit: table[total, matches]
+        max_total = int(self.total_required.max()) if len(role_sets) else 0
+        self._percentages = np.zeros((max_total + 1, max_total + 1), dtype=np.float64)
+        for total in range(1, max_total + 1):
+            for matches in range(total + 1):
+                self._percentages[total, matches] = round((matches / total) * 100, 1)
+
+    @classmethod
+    def from_catalog(cls, catalog=None, **kwargs):
+        """Engine over every role of a job catalog (default: the shared one)"""
+        catalog = catalog or get_job_catalog()
+        return cls(catalog.as_dict(), **kwargs)
+
+    def encode_users(self, users_skills):
+        """
+        Encode users as a boolean (users x vocabulary) matrix
+
+        Skills outside the vocabulary are dropped: no role requires them,
+        so they can never change a score.
+        """
+        vocabulary = self.vocabulary
+        matrix = np.zeros((len(users_skills), len(vocabulary)), dtype=bool)
+        for row, skills in enumerate(users_skills):
+            columns = [vocabulary[i] for i in REGISTRY.ids(skills) if i in vocabulary]
+            matrix[row, columns] = True
+        return matrix
+
+    def score(self, users_skills, weighted=False):
+        """
+        Match every user against every role
+
+        Args:
+            users_skills: List of skill lists, one per user
+            weighted: Also compute demand-weighted percentages
+
+        Returns:
+            Dict with 'roles' (column names), 'match_percentage', 'matching_count'
+            and 'gap_count' (users x roles arrays) and 'total_required' (per role),
+            plus 'weighted_match_percentage' when weighted
+        """
+        n_users, n_roles = len(users_skills), len(self.role_names)
+        matching = np.zeros((n_users, n_roles), dtype=np.int32)
+        matched_weight = np.zeros((n_users, n_roles), dtype=np.float64) if weighted else None
+
+        for start in range(0, n_users, self.chunk_size):
+            chunk = self.encode_users(users_skills[start:start + self.chunk_size])
+            counts = chunk.astype(np.float32) @ self._role_operand
+            matching[start:start + len(chunk)] = np.rint(counts).astype(np.int32)
+            if weighted:
+                matched_weight[start:start + len(chunk)] = chunk.astype(np.float64) @ self._weight_operand
+
+        total = np.broadcast_to(self.total_required, matching.shape)
+        result = {
+            'roles': self.role_names,
+            'match_percentage': self._percentages[total, matching],
+            'matching_count': matching,
+            'total_required': self.total_required,
+            'gap_count': total - matching
+        }
+        if weighted:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                percentages = np.where(self.total_weight > 0, matched_weight / self.total_weight * 100, 0.0)
+            result['weighted_match_percentage'] = np.round(percentages, 1)
+        return result
+
+    def pair_result(self, scores, user_index, role_index):
+        """One cell of score() in the calculate_match_score() dict shape"""
+        return {
+            'match_percentage': float(scores['match_percentage'][user_index, role_index]),
+            'matching_count': int(scores['matching_count'][user_index, role_index]),
+            'total_required': int(scores['total_required'][role_index]),
+            'gap_count': int(scores['gap_count'][user_index, role_index])
+        }
@@ -0,0 +1,230 @@
+# 🧠 CAREER NAVIGATOR - Skill Vocabulary, Matcher & Registry
+# Compiled, word-boundary-aware keyword matching for resume text
+# and canonical, interned skill IDs shared by data.py and agents.py
+
+import hashlib
+import json
+import os
+import re
+import threading
+
+DEFAULT_VOCABULARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_vocabulary.json")
+DEFAULT_ALIASES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_aliases.json")
+
+# A keyword only counts when it is not glued to other word characters,
+# so 'c' does not fire inside 'code' and 'java' does not fire inside 'javascript'.
+# '+' and '#' are treated as word characters on the right so 'c' != 'c++' / 'c#'.
+_LEFT_BOUNDARY = r"(?<![a-z0-9])"
+_RIGHT_BOUNDARY = r"(?![a-z0-9+#])"
+
+
+class SkillMatcher:
+    """
+    Finds every vocabulary skill in a text with one compiled regex pass
+
+    All keywords are folded into a single alternation (longest first) that
+    is compiled once, so adding keywords does not add extra scans over the text.
+    """
+
+    def __init__(self, categories, display=None, version=1):
+        """
+        Args:
+            categories: Dict of category name -> list of lowercase keywords
+            display: Optional dict of keyword -> display name (default: title case)
+            version: Vocabulary version, bumped whenever keywords change
+        """
+        self.categories = {name: [kw.lower().strip() for kw in keywords] for name, keywords in categories.items()}
+        self.display = {kw.lower(): name for kw, name in (display or {}).items()}
+        self.version = version
+
+        # Changes whenever the version or any keyword / display name changes
+        digest = hashlib.sha256(
+            json.dumps([self.categories, self.display], sort_keys=True).encode("utf-8")
+        ).hexdigest()[:12]
+        self.fingerprint = f"v{version}-{digest}"
+
+        # keyword -> (category, position) so results keep vocabulary order
+        self._index = {}
+        for category, keywords in self.categories.items():
+            for position, keyword in enumerate(keywords):
+                self._index.setdefault(keyword, (category, position))
+
+        alternatives = sorted(self._index, key=len, reverse=True)
+        self.max_keyword_length = len(alternatives[0]) if alternatives else 0
+        body = "|".join(re.escape(kw).replace(r"\ ", r"\s+") for kw in alternatives)
+        self._pattern = re.compile(f"{_LEFT_BOUNDARY}(?:{body}){_RIGHT_BOUNDARY}")
+        self._whitespace = re.compile(r"\s+")
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_VOCABULARY_PATH):
+        """Build a matcher from a JSON vocabulary file"""
+        with open(path, encoding="utf-8") as f:
+            vocabulary = json.load(f)
+        return cls(
+            vocabulary["categories"],
+            display=vocabulary.get("display"),
+            version=vocabulary.get("version", 1)
+        )
+
+    def find(self, text):
+        """
+        Find all vocabulary keywords in lowercase text
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            Set of matched keywords (canonical lowercase form)
+        """
+        found = set()
+        for match in self._pattern.finditer(text):
+            keyword = match.group(0)
+            if keyword not in self._index:
+                # Multi-word keyword matched across a line break / extra spaces
+                keyword = self._whitespace.sub(" ", keyword)
+            found.add(keyword)
+        return found
+
+    def categorize(self, found):
+        """
+        Group matched keywords by category, in vocabulary order
+
+        Args:
+            found: Iterable of keywords returned by find()
+
+        Returns:
+            Dict of category -> list of display names
+        """
+        grouped = {category: [] for category in self.categories}
+        for keyword in sorted(found, key=lambda kw: self._index[kw][1]):
+            category = self._index[keyword][0]
+            grouped[category].append(self.display.get(keyword, keyword.title()))
+        return grouped
+
+
+def load_skill_matcher(path=None):
+    """
+    Load the skill matcher for a vocabulary file
+
+    Args:
+        path: JSON vocabulary file (default: $SKILL_VOCABULARY_PATH or bundled file)
+
+    Returns:
+        Compiled SkillMatcher
+    """
+    return SkillMatcher.from_file(path or os.environ.get("SKILL_VOCABULARY_PATH") or DEFAULT_VOCABULARY_PATH)
+
+
+# Compiled once at import and shared by every resume parse
+DEFAULT_MATCHER = load_skill_matcher()
+
+
+# -------------------------------
+# 🔢 Skill Registry (canonical names -> interned IDs)
+# -------------------------------
+
+class SkillRegistry:
+    """
+    Canonicalises skill names once and interns them as small integer IDs
+
+    "REST APIs", "rest api" and " Restful APIs " all map to the same
+    canonical name ("rest apis") and therefore the same ID. Every raw string
+    seen is memoized, so after the first lookup normalisation costs a single
+    dict hit. IDs are process-local: compare them, never persist them.
+    """
+
+    def __init__(self, aliases=None):
+        """
+        Args:
+            aliases: Dict of canonical name -> list of alternative spellings
+        """
+        self._whitespace = re.compile(r"\s+")
+        self._aliases = {}
+        for canonical, alternatives in (aliases or {}).items():
+            canonical = self._clean(canonical)
+            for alternative in alternatives:
+                self._aliases[self._clean(alternative)] = canonical
+
+        self._ids = {}      # canonical name -> id
+        self._names = []    # id -> canonical name
+        self._display = []  # id -> first non-canonical spelling seen ("Node.js"), None until one is
+        self._memo = {}     # raw string -> id
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_ALIASES_PATH):
+        """Build a registry from a JSON alias table"""
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _clean(self, skill):
+        return self._whitespace.sub(" ", skill.strip().lower())
+
+    def canonical(self, skill):
+        """Canonical lowercase name of a skill"""
+        return self._names[self.skill_id(skill)]
+
+    def skill_id(self, skill):
+        """Interned integer ID of a skill"""
+        skill_id = self._memo.get(skill)
+        if skill_id is not None:
+            return skill_id
+
+        cleaned = self._clean(skill)
+        canonical = self._aliases.get(cleaned, cleaned)
+        with self._lock:
+            skill_id = self._ids.get(canonical)
+            if skill_id is None:
+                skill_id = len(self._names)
+                self._names.append(canonical)
+                self._display.append(None)
+                self._ids[canonical] = skill_id
+            # The bare canonical form (data files, gap lists) never claims the display name
+            if self._display[skill_id] is None and skill.strip() != canonical:
+                self._display[skill_id] = skill.strip()
+            self._memo[skill] = skill_id
+        return skill_id
+
+    def ids(self, skills):
+        """Set of IDs for a list of skill names (blank entries skipped)"""
+        memo = self._memo
+        result = set()
+        for skill in skills:
+            if not skill:
+                continue
+            skill_id = memo.get(skill)
+            result.add(skill_id if skill_id is not None else self.skill_id(skill))
+        return result
+
+    def name(self, skill_id):
+        """Canonical name for an ID"""
+        return self._names[skill_id]
+
+    def names(self, skill_ids):
+        """Canonical names for an iterable of IDs"""
+        names = self._names
+        return [names[skill_id] for skill_id in skill_ids]
+
+    def display_name(self, skill_id):
+        """Human-facing spelling (the first one this process saw) for an ID, None if none yet"""
+        return self._display[skill_id]
+
+    def display_names(self, skill_ids):
+        """
+        Human-facing spelling (the first one this process saw) for an iterable of IDs
+
+        Skills only ever seen in canonical form fall back to their canonical name.
+        Depends on what ran earlier, so records store the spellings that
+        differ from it instead of relying on it.
+        """
+        display, names = self._display, self._names
+        return [display[skill_id] or names[skill_id] for skill_id in skill_ids]
+
+
+# Shared by every module so IDs agree across data.py, catalog.py and agents.py
+REGISTRY = SkillRegistry.from_file(os.environ.get("SKILL_ALIASES_PATH") or DEFAULT_ALIASES_PATH)
+
+
+def canonical_skill(skill):
+    """Canonical lowercase name of a skill, through the shared registry"""
+    return REGISTRY.canonical(skill)